@@ -0,0 +1,79 @@
+import logging
+import os
+import re
+import time
+from extractors.wanted_job_search import JOB_CARD_CLASS, JOB_CARD_SPEC, JOB_CARD_STRAINER
+from utils.html_parser import get_engine, parse_html
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "..", "fixtures", "wanted", "search_python.html")
+CARD_COUNT = 500
+ROUNDS = 5
+
+
+def build_listing(card_count=CARD_COUNT):
+    """Wanted 픽스처의 카드를 반복해 card_count개의 카드가 있는 검색 결과 페이지 생성"""
+    with open(FIXTURE_PATH, encoding="utf-8") as file:
+        html = file.read()
+    cards = re.findall(r'<div class="JobCard_container.*?</a>\s*</div>', html, re.S)
+    repeated = "".join(cards[i % len(cards)] for i in range(card_count))
+    start = html.index(cards[0])
+    end = html.index(cards[-1]) + len(cards[-1])
+    return html[:start] + repeated + html[end:]
+
+
+def _find_by_prefix(job, tag_name, prefix):
+    return job.find(lambda tag: tag.name == tag_name and tag.get('class') and any(c.startswith(prefix) for c in tag.get('class', [])))
+
+
+def extract_legacy(soup):
+    """필드마다 find(lambda ...)로 카드 하위 트리를 다시 훑는 이전 방식"""
+    rows = []
+    for job in soup.find_all("div", class_=lambda x: x and x.startswith("JobCard_container")):
+        link_element = job.find("a")
+        if not link_element:
+            continue
+        title_element = _find_by_prefix(job, "strong", "JobCard_title")
+        company_element = _find_by_prefix(job, "span", "JobCard_companyName")
+        reward_element = _find_by_prefix(job, "span", "JobCard_reward")
+        rows.append({
+            "link": link_element.get("href", ""),
+            "title": title_element.text.strip() if title_element else "제목 없음",
+            "company_name": company_element.text.strip() if company_element else "회사명 없음",
+            "reward": reward_element.text.strip() if reward_element else "보상금 정보 없음",
+        })
+    return rows
+
+
+def extract_with_spec(soup):
+    """선언적 명세로 카드마다 한 번만 순회하는 현재 방식"""
+    return [JOB_CARD_SPEC.extract(job) for job in soup.find_all("div", class_=JOB_CARD_CLASS)]
+
+
+def best_of(func, soup, rounds=ROUNDS):
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func(soup)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_card_extraction_benchmark():
+    """500개 카드 페이지에서 두 방식의 결과가 같은지 확인하고 추출 시간 비교"""
+    soup = parse_html(build_listing(), parse_only=JOB_CARD_STRAINER)
+    legacy_rows = extract_legacy(soup)
+    assert len(legacy_rows) == CARD_COUNT
+    assert extract_with_spec(soup) == legacy_rows
+
+    legacy = best_of(extract_legacy, soup)
+    spec = best_of(extract_with_spec, soup)
+    logger.info(f"카드 {CARD_COUNT}개 필드 추출 ({get_engine()}): "
+                f"이전 방식 {legacy * 1000:.1f}ms, 명세 방식 {spec * 1000:.1f}ms ({legacy / spec:.1f}배)")
+
+
+if __name__ == "__main__":
+    test_card_extraction_benchmark()
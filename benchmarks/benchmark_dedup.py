@@ -0,0 +1,51 @@
+import logging
+import random
+import time
+from extractors.dedup import dedupe
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+logging.getLogger("extractors.dedup").setLevel(logging.WARNING)
+
+SIZES = (5000, 10000, 20000)
+ROLES = ["Python Engineer", "Backend Developer", "Data Engineer", "Django Developer", "Platform Engineer", "ML Engineer"]
+LEVELS = ["Senior", "Staff", "Junior", "Lead", ""]
+
+
+def build_postings(count, seed=11):
+    """
+    키워드 3개로 WWR과 RemoteOK를 검색한 것 같은 결과 생성
+
+    공고의 절반은 두 출처에 모두 올라오고(회사 표기가 조금 다름), 키워드마다 같은 공고가 다시 나옵니다.
+    """
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count // 3):
+        title = f"{rng.choice(LEVELS)} {rng.choice(ROLES)} {rng.choice(['', '(Remote)', 'II'])}".strip()
+        company = f"Company {rng.randrange(count // 4)}"
+        postings.append(JobDataWWR(title, f"{company} Inc.", "Anywhere in the World", "Not specified",
+                                   f"https://weworkremotely.com/remote-jobs/{company.lower().replace(' ', '-')}-{i}"))
+        if i % 2 == 0:
+            postings.append(JobDataRemoteOK.create(title, company, "Worldwide", f"https://remoteok.com/remote-jobs/job-{i}"))
+    keyword_results = [rng.sample(postings, len(postings) * 2 // 3) for _ in range(3)]
+    jobs = [job for result in keyword_results for job in result]
+    return jobs[:count]
+
+
+def test_dedup_benchmark():
+    """공고 수에 따른 중복 병합 시간 (공고당 시간이 거의 일정하면 선형)"""
+    for size in SIZES:
+        jobs = build_postings(size)
+        started = time.perf_counter()
+        kept, found_on = dedupe(jobs)
+        elapsed = time.perf_counter() - started
+        merged = sum(1 for sources in found_on if ", " in sources)
+        logger.info(f"공고 {len(jobs)}개 -> {len(kept)}개 (출처 병합 {merged}개): "
+                    f"{elapsed * 1000:.0f}ms, 공고당 {elapsed / len(jobs) * 1e6:.1f}µs")
+
+
+if __name__ == "__main__":
+    test_dedup_benchmark()
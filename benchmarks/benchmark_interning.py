@@ -0,0 +1,85 @@
+import gc
+import logging
+import os
+import re
+import tracemalloc
+from extractors.job_table import JobTable
+from extractors.remoteok import parse_listing as parse_remoteok_listing
+from extractors.wanted_job_search import parse_listing as parse_wanted_listing
+from extractors.wwr import parse_listing as parse_wwr_listing
+from utils.intern_pool import get_intern_pool
+
+# 로깅 설정 (페이지마다 찍히는 파서 진행 로그는 숨김)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+for name in ("extractors.wwr", "extractors.remoteok", "extractors.wanted_job_search"):
+    logging.getLogger(name).setLevel(logging.WARNING)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "..", "fixtures")
+ROWS_PER_PAGE = 200
+KEYWORD_COUNT = 10
+
+# 출처 -> (파싱 함수, 픽스처에서 공고 하나에 해당하는 HTML 블록 패턴)
+SOURCES = {
+    "wwr": (lambda content: parse_wwr_listing(content)["jobs"], r'<li class="new-listing-container.*?</li>'),
+    "remoteok": (parse_remoteok_listing, r'<tr class="job job-.*?</tr>'),
+    "wanted": (parse_wanted_listing, r'<div class="JobCard_container.*?</a>\s*</div>'),
+}
+
+
+def build_listing(source, row_count=ROWS_PER_PAGE):
+    """픽스처의 공고 블록을 반복해 row_count개의 공고가 있는 검색 결과 페이지 생성"""
+    with open(os.path.join(FIXTURE_DIR, source, "search_python.html"), encoding="utf-8") as file:
+        html = file.read()
+    blocks = re.findall(SOURCES[source][1], html, re.S)
+    start = html.index(blocks[0])
+    end = html.index(blocks[-1]) + len(blocks[-1])
+    # 제목은 공고마다 달라지도록 번호를 붙임 (회사, 위치, 태그 등은 실제처럼 반복)
+    repeated = "".join(re.sub(r"(__title\">|<strong[^>]*>|JobCard_title[^>]*>)", rf"\g<1>{i} ", blocks[i % len(blocks)])
+                       for i in range(row_count))
+    return html[:start] + repeated + html[end:]
+
+
+def scrape_all(pages):
+    """키워드마다 세 출처의 페이지를 파싱한 결과 (검색 결과 캐시처럼 모두 보관)"""
+    return [[job for source, content in pages.items() for job in SOURCES[source][0](content)]
+            for _ in range(KEYWORD_COUNT)]
+
+
+def retained(build):
+    """build()의 결과가 반환 후에도 차지하는 메모리 (바이트)와 결과 반환"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def measure(pages, enabled):
+    pool = get_intern_pool()
+    pool.clear()
+    pool.max_size = 50000 if enabled else 0
+    list_bytes, results = retained(lambda: scrape_all(pages))
+    table_bytes, tables = retained(lambda: [JobTable.from_records(jobs) for jobs in results])
+    return list_bytes, table_bytes, results, tables
+
+
+def test_interning_benchmark():
+    """인터닝 풀 사용 여부에 따른 검색 결과 캐시 메모리 비교"""
+    pages = {source: build_listing(source) for source in SOURCES}
+    plain_list, plain_table, plain_results, _ = measure(pages, enabled=False)
+    interned_list, interned_table, interned_results, _ = measure(pages, enabled=True)
+    assert plain_results == interned_results
+
+    job_count = sum(len(jobs) for jobs in interned_results)
+    logger.info(f"키워드 {KEYWORD_COUNT}개, 작업 {job_count}개, 풀의 고유 문자열 {len(get_intern_pool())}개")
+    logger.info(f"레코드 목록: 인터닝 없음 {plain_list / 1e6:.2f}MB, "
+                f"인터닝 {interned_list / 1e6:.2f}MB ({1 - interned_list / plain_list:.0%} 감소)")
+    logger.info(f"JobTable (레코드 목록 제외): 인터닝 없음 {plain_table / 1e6:.2f}MB, "
+                f"인터닝 {interned_table / 1e6:.2f}MB ({1 - interned_table / plain_table:.0%} 감소)")
+
+
+if __name__ == "__main__":
+    test_interning_benchmark()
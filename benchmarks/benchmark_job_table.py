@@ -0,0 +1,89 @@
+import csv
+import io
+import logging
+import random
+import time
+import tracemalloc
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+from extractors.job_table import JobTable
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+JOB_COUNT = 30000
+COMPANIES = [f"Company {i}" for i in range(800)]
+LOCATIONS = ["Anywhere in the World", "USA Only", "Europe", "서울", "Worldwide", "Canada"]
+TAGS = ["python, django", "python, aws", "golang, backend", "react, typescript", "data, sql"]
+
+
+def build_records(count=JOB_COUNT, seed=7):
+    """세 출처가 섞인 현실적인 레코드 목록 생성 (스크래핑처럼 행마다 새 문자열 객체)"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        # 파싱 결과처럼 같은 값이라도 행마다 별도의 문자열 객체가 되도록 복사
+        company = "".join(rng.choice(COMPANIES))
+        location = "".join(rng.choice(LOCATIONS))
+        kind = i % 3
+        if kind == 0:
+            records.append(JobDataWWR(f"Senior Python Engineer {i}", company, location, "Not specified",
+                                      f"https://weworkremotely.com/remote-jobs/company-python-engineer-{i}"))
+        elif kind == 1:
+            records.append(JobData(f"백엔드 개발자 {i}", company, "합격보상금 100만원", f"https://www.wanted.co.kr/wd/{200000 + i}"))
+        else:
+            records.append(JobDataRemoteOK.create(f"Backend Engineer {i}", company, location,
+                                                  f"https://remoteok.com/remote-jobs/{100000 + i}",
+                                                  salary=f"💰 ${rng.randint(5, 20) * 10}k",
+                                                  tags=rng.choice(TAGS).split(", "),
+                                                  posted_date=f"2024-05-{rng.randint(1, 28):02d}"))
+    return records
+
+
+def traced(build):
+    """build()가 만든 객체가 차지하는 메모리 (바이트)와 결과 반환"""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, result
+
+
+def timed(func):
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def write_csv(headers, rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(headers)
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def test_job_table_benchmark():
+    """레코드 목록과 JobTable의 메모리, 필터/정렬 시간 비교와 CSV 내보내기 시간 측정"""
+    list_bytes, records = traced(build_records)
+    table_bytes, table = traced(lambda: JobTable.from_records(build_records()))
+    assert list(table) == records
+
+    logger.info(f"작업 {JOB_COUNT}개 메모리: 레코드 목록 {list_bytes / 1e6:.1f}MB, "
+                f"JobTable {table_bytes / 1e6:.1f}MB ({list_bytes / table_bytes:.1f}배 감소)")
+
+    company = COMPANIES[0]
+    list_filter = timed(lambda: [job for job in records if job[1] == company])
+    table_filter = timed(lambda: table.filter(company=company))
+    list_sort = timed(lambda: sorted(records, key=lambda job: job[1]))
+    table_sort = timed(lambda: table.sort_by("company"))
+    table_export = timed(lambda: write_csv(*table.export_rows()))
+    logger.info(f"회사 필터: 목록 {list_filter:.1f}ms, JobTable {table_filter:.1f}ms")
+    logger.info(f"회사 정렬: 목록 {list_sort:.1f}ms, JobTable {table_sort:.1f}ms")
+    logger.info(f"CSV 내보내기 (출처 통합 헤더): JobTable {table_export:.1f}ms")
+
+
+if __name__ == "__main__":
+    test_job_table_benchmark()
@@ -0,0 +1,46 @@
+import logging
+import re
+import time
+from benchmarks.benchmark_job_table import JOB_COUNT, build_records
+from extractors.job_table import JobTable
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+THRESHOLDS = (60000, 120000, 180000)
+_LEGACY_AMOUNT = re.compile(r"\$(\d+)k")
+
+
+def scan_salary_at_least(records, amount):
+    """인덱스 없이 매 조회마다 모든 행의 급여 문자열을 정규식으로 확인하는 방식"""
+    matched = []
+    for job in records:
+        salary = getattr(job, "salary", "")
+        amounts = [int(value) * 1000 for value in _LEGACY_AMOUNT.findall(salary)]
+        if amounts and max(amounts) >= amount:
+            matched.append(job)
+    return matched
+
+
+def test_salary_index_benchmark():
+    """급여 이상 조회: 전체 행 정규식 확인과 정렬 인덱스 이진 탐색 비교"""
+    records = build_records()
+    started = time.perf_counter()
+    table = JobTable.from_records(records)
+    build_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"작업 {JOB_COUNT}개 JobTable 생성 (급여 파싱과 인덱스 포함): {build_ms:.1f}ms")
+
+    for amount in THRESHOLDS:
+        started = time.perf_counter()
+        scanned = scan_salary_at_least(records, amount)
+        scan_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        indexed = table.salary_at_least(amount)
+        index_ms = (time.perf_counter() - started) * 1000
+        assert list(indexed) == scanned
+        logger.info(f"${amount:,} 이상 {len(indexed)}개: 전체 확인 {scan_ms:.1f}ms, 인덱스 {index_ms:.2f}ms")
+
+
+if __name__ == "__main__":
+    test_salary_index_benchmark()
@@ -0,0 +1,80 @@
+"""
+선언적 채용 공고 카드 추출 명세
+
+필드 이름마다 (태그 이름, 클래스 접두사, 속성)을 미리 선언해 두고, 카드의 하위 요소를
+한 번만 순회하면서 모든 필드를 채웁니다. 필드마다 find(lambda ...)로 하위 트리 전체를
+다시 훑는 대신 태그 이름으로 후보 필드를 바로 찾고, 모든 필드가 채워지면 순회를 멈춥니다.
+"""
+from bs4 import Tag
+
+
+class Field:
+    """카드 안에서 값을 꺼낼 요소 하나에 대한 명세"""
+
+    def __init__(self, tag, class_prefix=None, attr=None, default=None):
+        """
+        Args:
+            tag (str): 태그 이름 (예: "span")
+            class_prefix (str, optional): 클래스 중 하나가 이 접두사로 시작해야 함 (예: "JobCard_title")
+            attr (str, optional): 텍스트 대신 가져올 속성 이름 (예: "href", 요소에 속성이 없으면 빈 문자열)
+            default (str, optional): 요소를 찾지 못했을 때 사용할 값
+        """
+        self.tag = tag
+        self.class_prefix = class_prefix
+        self.attr = attr
+        self.default = default
+
+    def matches(self, element):
+        """요소가 이 필드의 조건(클래스 접두사)을 만족하는지 여부 - 태그 이름은 호출 전에 확인됨"""
+        if self.class_prefix is None:
+            return True
+        classes = element.get("class")
+        if not classes:
+            return False
+        return any(c.startswith(self.class_prefix) for c in classes)
+
+    def value(self, element):
+        """요소에서 값 추출 (속성 또는 앞뒤 공백을 제거한 텍스트)"""
+        if self.attr is not None:
+            return element.get(self.attr, "")
+        return element.get_text().strip()
+
+
+class CardSpec:
+    """필드 이름 -> Field 명세를 미리 정리해 두고 카드마다 한 번의 순회로 추출하는 클래스"""
+
+    def __init__(self, **fields):
+        self.fields = fields
+        # 태그 이름 -> [(필드 이름, Field)] (선언 순서 유지)
+        self._by_tag = {}
+        for name, field in fields.items():
+            self._by_tag.setdefault(field.tag, []).append((name, field))
+
+    def extract(self, card):
+        """
+        카드 요소에서 모든 필드 추출
+
+        각 필드는 문서 순서상 조건을 만족하는 첫 번째 요소에서 값을 가져오며,
+        찾지 못한 필드는 default 값을 가집니다.
+
+        Returns:
+            dict: 필드 이름 -> 값
+        """
+        result = {}
+        remaining = len(self.fields)
+        by_tag = self._by_tag
+        for element in card.descendants:
+            if not isinstance(element, Tag):
+                continue
+            candidates = by_tag.get(element.name)
+            if not candidates:
+                continue
+            for name, field in candidates:
+                if name not in result and field.matches(element):
+                    result[name] = field.value(element)
+                    remaining -= 1
+            if not remaining:
+                break
+        for name, field in self.fields.items():
+            result.setdefault(name, field.default)
+        return result
@@ -0,0 +1,152 @@
+"""
+여러 키워드와 여러 출처의 검색 결과에서 중복 공고를 합치는 모듈
+
+같은 공고가 WWR과 RemoteOK에 함께 올라오거나 "python, django"처럼 여러 키워드로 검색하면
+같은 공고가 결과에 여러 번 나타납니다. 중복은 두 단계로 찾습니다.
+
+1. 정규화한 링크가 같으면 같은 공고입니다 (http/https, www., 끝의 /, 추적용 쿼리 무시,
+   RemoteOK의 슬러그 URL은 공고 ID로 통일).
+2. 링크가 다르면 제목 단어 집합의 MinHash 서명을 밴드로 나누고 회사 단어의 MinHash 값을 더한 LSH 버킷으로 후보를 찾고,
+   후보와 실제 단어 Jaccard 유사도를 비교해 다른 출처의 같은 공고를 찾습니다. 각 공고는 자신의
+   버킷에 있는 대표 공고와만 비교하므로 전체 비교 없이 공고 수에 거의 비례하는 시간에 끝납니다.
+
+합쳐진 공고는 처음 나온 레코드를 남기고, 발견된 출처 목록(found_on, 예: "wwr, remoteok")을 합칩니다.
+대표 레코드와 출처가 같은 공고는 링크가 다르면 서로 다른 채용(예: 지역별 공고)일 수 있으므로
+제목이 비슷해도 합치지 않습니다.
+"""
+import random
+import re
+import zlib
+from urllib.parse import parse_qsl, urlencode, urlsplit
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# MinHash/LSH 설정 - 밴드 6개 x 행 3개이면 제목 Jaccard 유사도가 0.8인 쌍은 약 99% 확률로 같은 버킷에 들어감
+NUM_PERM = 18
+BANDS = 6
+ROWS_PER_BAND = NUM_PERM // BANDS
+_PRIME = (1 << 31) - 1
+_rng = random.Random(20240501)  # 실행마다 같은 서명이 나오도록 고정 시드 사용
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+# 후보를 중복으로 판정하는 최소 Jaccard 유사도
+TITLE_THRESHOLD = 0.8
+COMPANY_THRESHOLD = 0.5
+
+# 링크 비교 시 무시하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = {"ref", "source", "src", "referrer", "gclid", "fbclid"}
+
+# 회사 이름 비교 시 무시하는 법인 형태 단어
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "gmbh", "co", "corp", "corporation", "company", "limited", "주", "주식회사"}
+
+_WORD = re.compile(r"\w+")
+_REMOTEOK_JOB_PATH = re.compile(r"^/remote-jobs/(?:[^/]*-)?(\d+)$")
+
+
+def canonical_link(url):
+    """비교용으로 정규화한 링크 (스킴, www., 끝의 /, 추적용 쿼리, 프래그먼트 제거)"""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parts.path.rstrip("/") or "/"
+    if host == "remoteok.com":
+        # /remote-jobs/senior-python-developer-acme-1001 과 /remote-jobs/1001 은 같은 공고
+        match = _REMOTEOK_JOB_PATH.match(path)
+        if match:
+            path = f"/remote-jobs/{match.group(1)}"
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_"))
+    return f"{host}{path}?{urlencode(query)}" if query else f"{host}{path}"
+
+
+def _words(text, ignored=frozenset()):
+    return frozenset(word for word in _WORD.findall(text.lower()) if word not in ignored)
+
+
+def _jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _minhash(words, prefix, permutations):
+    hashes = [zlib.crc32(f"{prefix}:{word}".encode()) for word in words]
+    if not hashes:
+        return [None] * len(permutations)
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in permutations]
+
+
+def _band_keys(title_words, company_words):
+    """
+    제목 단어 MinHash 서명의 밴드와 회사 단어 MinHash 값으로 LSH 버킷 키 목록 생성
+
+    회사 값을 모든 키에 포함하므로 "Senior Python Engineer"처럼 흔한 제목도 회사가 비슷한 공고끼리만
+    같은 버킷에 모여, 버킷 크기가 전체 공고 수에 따라 커지지 않습니다.
+    """
+    signature = _minhash(title_words, "t", _PERMUTATIONS)
+    company = _minhash(company_words, "c", _PERMUTATIONS[:1])[0]
+    return [(band, company, tuple(signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]))
+            for band in range(BANDS)]
+
+
+def _split_sources(found_on):
+    return [source for source in found_on.split(", ") if source]
+
+
+def dedupe(jobs, found_on=None):
+    """
+    중복 공고를 합친 (레코드 목록, 발견 출처 목록) 반환
+
+    Args:
+        jobs (iterable): 구직 정보 레코드 (JobData, JobDataWWR, JobDataRemoteOK)
+        found_on (list, optional): 레코드별 발견 출처 문자열 (기본값: 각 레코드의 source)
+
+    Returns:
+        tuple: (처음 나온 순서대로의 대표 레코드 목록, 대표 레코드별 ", "로 구분한 출처 문자열 목록)
+    """
+    kept = []
+    kept_sources = []       # 대표 레코드별 출처 목록 (처음 나온 순서)
+    kept_words = []         # 대표 레코드별 (제목 단어, 회사 단어)
+    by_link = {}            # 정규화한 링크 -> 대표 번호
+    buckets = {}            # LSH 버킷 키 -> 대표 번호 목록
+    total = 0
+
+    for i, job in enumerate(jobs):
+        total = i + 1
+        sources = _split_sources(found_on[i]) if found_on is not None else [job.source]
+        link = canonical_link(job.link)
+        match = by_link.get(link)
+        title_words = company_words = keys = None
+
+        if match is None:
+            title_words = _words(job[0])
+            company_words = _words(job[1], COMPANY_SUFFIXES)
+            keys = _band_keys(title_words, company_words)
+            candidates = dict.fromkeys(rep for key in keys for rep in buckets.get(key, ()))
+            for rep in candidates:
+                # 대표 레코드와 같은 출처이면 링크가 같을 때만 합침
+                if kept[rep].source == job.source:
+                    continue
+                rep_title, rep_company = kept_words[rep]
+                if (_jaccard(title_words, rep_title) >= TITLE_THRESHOLD
+                        and _jaccard(company_words, rep_company) >= COMPANY_THRESHOLD):
+                    match = rep
+                    break
+
+        if match is None:
+            match = len(kept)
+            kept.append(job)
+            kept_sources.append([])
+            kept_words.append((title_words, company_words))
+            for key in keys:
+                buckets.setdefault(key, []).append(match)
+        by_link.setdefault(link, match)
+        merged = kept_sources[match]
+        merged.extend(source for source in sources if source not in merged)
+
+    if len(kept) < total:
+        logger.info(f"중복 공고 {total - len(kept)}개를 합쳤습니다 ({total}개 -> {len(kept)}개)")
+    return kept, [", ".join(sources) for sources in kept_sources]
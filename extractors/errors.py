@@ -0,0 +1,16 @@
+"""
+스크래퍼에서 사용하는 예외 클래스
+"""
+
+
+class ScrapeFailedError(Exception):
+    """소스에서 콘텐츠를 가져오지 못한 경우 (결과가 0건인 것과 구분하기 위해 사용)"""
+
+    def __init__(self, message, captcha=False):
+        """
+        Args:
+            message (str): 오류 메시지
+            captcha (bool): 캡차/봇 차단으로 실패했는지 여부
+        """
+        super().__init__(message)
+        self.captcha = captcha
@@ -1,79 +1,50 @@
 """
-구직 정보를 표현하는 기본 클래스 모듈
+구직 정보를 표현하는 기본 레코드 모듈
+
+각 소스의 구직 정보는 namedtuple 기반의 불변 레코드로 표현합니다.
+- 모든 레코드는 링크를 마지막 필드로 두므로 템플릿은 출처와 관계없이 job[-1]을 지원 링크로 씁니다.
+- 인스턴스에 __dict__가 없어 캐시에 작업이 많이 쌓여도 작업당 메모리가 작습니다.
+- 출처(source)와 헤더(HEADERS)는 인스턴스가 아니라 클래스에 한 번만 저장합니다.
+- 회사, 위치처럼 여러 공고에 반복되는 필드(REPEATED_FIELDS)는 interned()로 공유 문자열을 사용합니다.
 """
+from collections import namedtuple
+from utils.intern_pool import get_intern_pool
+
+
+class JobRecord:
+    """모든 구직 정보 레코드의 공통 기능 (namedtuple 클래스와 함께 상속)"""
 
-class JobData:
-    """구직 정보의 기본 클래스"""
-    
-    def __init__(self, position, company, link, **kwargs):
-        """
-        기본 구직 정보 초기화
-        
-        Args:
-            position (str): 직무 이름
-            company (str): 회사 이름
-            link (str): 지원 링크
-            **kwargs: 추가 정보 (reward, location, salary 등)
-        """
-        self.position = position
-        self.company = company
-        self.link = link
-        
-        # 추가 정보 설정
-        self.location = kwargs.get('location', 'Not specified')
-        self.salary = kwargs.get('salary', 'Not specified')
-        self.reward = kwargs.get('reward', 'Not specified')
-        
-        # 기타 추가 정보
-        self.additional_info = {k: v for k, v in kwargs.items() 
-                              if k not in ['location', 'salary', 'reward']}
-        
-    def get_headers(self):
+    __slots__ = ()
+
+    # 하위 클래스에서 정의: 출처 이름, 열 순서대로의 CSV 헤더, 여러 공고에 반복되는 필드 이름
+    source = None
+    HEADERS = ()
+    REPEATED_FIELDS = ()
+
+    @classmethod
+    def get_headers(cls):
         """CSV 헤더 반환"""
-        headers = ["Position", "Company"]
-        # 기본 추가 필드
-        if self.location != 'Not specified':
-            headers.append("Location")
-        if self.salary != 'Not specified':
-            headers.append("Salary")
-        if self.reward != 'Not specified':
-            headers.append("Reward")
-        # 기타 추가 정보가 있으면 헤더에 추가
-        for key in sorted(self.additional_info.keys()):
-            headers.append(key.title())
-        headers.append("Link")
-        return headers
-        
-    def to_list(self):
-        """리스트 형식으로 데이터 반환"""
-        data = [self.position, self.company]
-        # 기본 추가 필드
-        if self.location != 'Not specified':
-            data.append(self.location)
-        if self.salary != 'Not specified':
-            data.append(self.salary)
-        if self.reward != 'Not specified':
-            data.append(self.reward)
-        # 기타 추가 정보가 있으면 데이터에 추가
-        for key in sorted(self.additional_info.keys()):
-            data.append(self.additional_info[key])
-        data.append(self.link)
-        return data
-        
+        return list(cls.HEADERS)
+
+    def interned(self):
+        """반복되는 필드 값을 공유 인터닝 풀의 문자열로 바꾼 레코드 반환"""
+        intern = get_intern_pool().intern
+        repeated = self.REPEATED_FIELDS
+        return self._make(intern(value) if field in repeated else value for field, value in zip(self._fields, self))
+
     def __str__(self):
         """문자열 표현"""
-        info = [f"{self.position} at {self.company}"]
-        if self.location != 'Not specified':
-            info.append(f"Location: {self.location}")
-        if self.salary != 'Not specified':
-            info.append(f"Salary: {self.salary}")
-        if self.reward != 'Not specified':
-            info.append(f"Reward: {self.reward}")
-        for key, value in sorted(self.additional_info.items()):
-            info.append(f"{key}: {value}")
-        info.append(f"Link: {self.link}")
+        info = [f"{self[0]} at {self[1]}"]
+        info.extend(f"{header}: {value}" for header, value in zip(self.HEADERS[2:], self[2:]) if value)
         return " | ".join(info)
-        
-    def __repr__(self):
-        """개발자를 위한 표현"""
-        return f"JobData(position='{self.position}', company='{self.company}', link='{self.link}', location='{self.location}', salary='{self.salary}', reward='{self.reward}', **{self.additional_info})"
+
+
+class JobData(JobRecord, namedtuple("JobData", ["position", "company", "reward", "link"])):
+    """Wanted 구직 정보 레코드 (직무, 회사, 보상금, 링크)"""
+
+    __slots__ = ()
+
+    source = "wanted"
+    HEADERS = ("Position", "Company", "Reward", "Link")
+    REPEATED_FIELDS = ("company", "reward")
+
@@ -1,39 +1,44 @@
 """
 RemoteOK 구직 정보를 표현하는 클래스
 """
-from extractors.job_data import JobData
+from collections import namedtuple
+from extractors.job_data import JobRecord
 
-class JobDataRemoteOK(JobData):
-    """RemoteOK 구직 정보 클래스"""
-    
-    def __init__(self, position, company, location, link, salary=None):
+# 모든 레코드와 같이 링크를 마지막 열에 둠 (템플릿은 job[-1]을 지원 링크로 사용)
+_FIELDS = ["title", "company_name", "location", "salary", "posted_date", "tags", "ad", "link"]
+
+
+class JobDataRemoteOK(JobRecord, namedtuple("JobDataRemoteOK", _FIELDS)):
+    """RemoteOK 구직 정보 레코드 (태그는 쉼표로 구분된 문자열, 광고는 "광고" 또는 빈 문자열)"""
+
+    __slots__ = ()
+
+    source = "remoteok"
+    HEADERS = ("Title", "Company", "Location", "Salary", "Posted Date", "Tags", "Ad", "Link")
+    REPEATED_FIELDS = ("company_name", "location", "salary", "posted_date", "tags", "ad")
+
+    @classmethod
+    def create(cls, title, company_name, location, link, salary=None, tags=None, posted_date="", is_ad=False):
         """
-        RemoteOK 구직 정보 초기화
-        
+        스크래핑한 값으로 레코드 생성 (반복되는 필드는 공유 인터닝 풀의 문자열 사용)
+
         Args:
-            position (str): 직무 이름
-            company (str): 회사 이름
+            title (str): 직무 이름
+            company_name (str): 회사 이름
             location (str): 근무 위치
             link (str): 지원 링크
-            salary (str, optional): 급여 정보
+            salary (str, optional): 급여 정보 (없으면 "Not specified")
+            tags (list, optional): 기술 태그 목록
+            posted_date (str, optional): 게시 날짜 (YYYY-MM-DD)
+            is_ad (bool, optional): 광고 여부
         """
-        super().__init__(
-            position=position,
-            company=company,
-            link=link,
-            location=location,
-            salary=salary if salary else "Not specified"
-        )
-    
-    def to_list(self):
-        # 기본 필드
-        result = [self.title, self.company_name, self.location, self.link, self.salary, self.posted_date]
-        # 태그를 쉼표로 구분된 문자열로 변환
-        tags_str = ", ".join(self.tags) if self.tags else ""
-        result.append(tags_str)
-        # 광고 여부 추가
-        result.append("광고" if self.is_ad else "")
-        return result
-        
-    def get_headers(self):
-        return ["Title", "Company", "Location", "Link", "Salary", "Posted Date", "Tags", "Ad"] 
\ No newline at end of file
+        return cls(
+            title,
+            company_name,
+            location,
+            salary if salary else "Not specified",
+            posted_date,
+            ", ".join(tags) if tags else "",
+            "광고" if is_ad else "",
+            link,
+        ).interned()
@@ -0,0 +1,390 @@
+"""
+열 단위(columnar) 구직 정보 테이블
+
+검색 결과 캐시에는 키워드마다 수천 개의 레코드가 쌓이므로 행마다 튜플과 문자열 객체를
+두는 대신 필드별 배열에 저장합니다.
+- 회사, 위치, 급여, 보상금, 태그, 게시일, 광고, 출처처럼 값이 반복되는 열은 사전 인코딩
+  (고유 값 목록 + 행마다 4바이트 코드)으로 저장합니다. 고유 값은 공유 인터닝 풀의 문자열을 쓰므로
+  워커 프로세스에서 파싱되어 페이지마다 따로 만들어진 값도 모든 키워드의 테이블이 한 객체를 공유합니다.
+- 제목과 링크처럼 행마다 다른 열은 UTF-8 바이트 하나에 이어 붙이고 오프셋 배열로 구분합니다.
+- 게시일은 정렬/비교를 위해 epoch 초 열(알 수 없으면 0)을 함께 둡니다.
+- 중복 공고를 합친 경우 공고가 발견된 출처 목록(found_on, 예: "wwr, remoteok")을 사전 인코딩 열로 둡니다.
+- 급여(없으면 보상금) 문자열은 저장할 때 고유 값마다 한 번 파싱해 최소/최대 금액(숫자 열, 알 수 없으면 NaN),
+  통화, 기간 열로 저장하고, 통화별로 연 환산 최대 금액 순으로 정렬한 인덱스를 만들어
+  salary_at_least()를 이진 탐색으로 처리합니다.
+
+필터, 정렬, 슬라이스는 열을 복사하지 않고 원본 열을 공유하면서 선택된 행 번호 배열만 새로 만듭니다.
+사전 인코딩 열의 필터는 고유 값마다 조건을 한 번만 평가한 뒤 정수 코드만 비교하고, 정렬도 고유 값의
+순위로 코드를 정렬합니다. 행은 필요할 때 원래 레코드 클래스의 인스턴스(튜플)로 만들어 돌려주므로
+템플릿과 내보내기 코드는 기존처럼 job[0], job[-1]을 사용합니다.
+"""
+import math
+import time
+from array import array
+from bisect import bisect_left
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+from extractors.salary import parse_salary
+from utils.intern_pool import get_intern_pool
+
+# 출처 이름 -> 레코드 클래스
+RECORD_TYPES = {kind.source: kind for kind in (JobData, JobDataWWR, JobDataRemoteOK)}
+
+# 레코드 필드 이름 -> 테이블 열 이름 (같은 의미의 필드는 한 열에 저장)
+FIELD_COLUMNS = {
+    "position": "title",
+    "title": "title",
+    "company": "company",
+    "company_name": "company",
+    "location": "location",
+    "salary": "salary",
+    "reward": "reward",
+    "link": "link",
+    "posted_date": "posted_date",
+    "tags": "tags",
+    "ad": "ad",
+}
+
+TEXT_COLUMNS = ("title", "link")
+DICT_COLUMNS = ("source", "company", "location", "salary", "reward", "posted_date", "tags", "ad")
+
+# 발견 출처 열 이름 (레코드 필드가 아니라 from_records의 found_on 인자로 채움)
+FOUND_ON_COLUMN = "found_on"
+
+# 급여 문자열에서 추출한 열 이름 (금액은 숫자 열, 통화/기간은 사전 인코딩 열)
+SALARY_MIN_COLUMN = "salary_min"
+SALARY_MAX_COLUMN = "salary_max"
+SALARY_CURRENCY_COLUMN = "salary_currency"
+SALARY_PERIOD_COLUMN = "salary_period"
+
+# epoch 초 열 이름 (where/sort_by/values에서 사용)
+EPOCH_COLUMN = "posted_epoch"
+
+
+def merged_columns(kinds):
+    """
+    여러 레코드 클래스의 열을 테이블 열 기준으로 합친 (헤더, 열 이름) 목록 (링크는 마지막)
+
+    Position(WWR/Wanted)과 Title(RemoteOK)처럼 헤더는 달라도 같은 열에 저장되는 필드는 한 열로 합치고,
+    헤더는 처음 나온 클래스의 것을 사용합니다.
+    """
+    merged = {}
+    for kind in kinds:
+        for field, header in zip(kind._fields, kind.HEADERS):
+            merged.setdefault(FIELD_COLUMNS[field], header)
+    link_header = merged.pop("link")
+    return [(header, column) for column, header in merged.items()] + [(link_header, "link")]
+
+
+class _DictColumn:
+    """사전 인코딩된 문자열 열 (고유 값 목록과 행별 코드)"""
+
+    def __init__(self):
+        self.values = [""]
+        self.codes = array("I")
+        self._index = {"": 0}
+        self._intern = get_intern_pool().intern
+
+    def append(self, value):
+        code = self._index.get(value)
+        if code is None:
+            value = self._intern(value)
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def get(self, i):
+        return self.values[self.codes[i]]
+
+    def gather(self, positions):
+        values, codes = self.values, self.codes
+        if positions is None:
+            return [values[code] for code in codes]
+        return [values[codes[p]] for p in positions]
+
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes) + sum(len(value.encode("utf-8")) for value in self.values)
+
+
+class _TextColumn:
+    """행마다 다른 문자열 열 (UTF-8 바이트를 이어 붙이고 오프셋으로 구분)"""
+
+    def __init__(self, values):
+        encoded = [value.encode("utf-8") for value in values]
+        self.offsets = array("I", [0])
+        end = 0
+        for chunk in encoded:
+            end += len(chunk)
+            self.offsets.append(end)
+        self.data = b"".join(encoded)
+
+    def get(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+    def gather(self, positions):
+        data, offsets = self.data, self.offsets
+        if positions is None:
+            positions = range(len(offsets) - 1)
+        return [data[offsets[p]:offsets[p + 1]].decode("utf-8") for p in positions]
+
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+
+class _NumberColumn:
+    """실수 열 (알 수 없는 값은 NaN)"""
+
+    def __init__(self):
+        self.data = array("d")
+
+    def append(self, value):
+        self.data.append(value)
+
+    def get(self, i):
+        return self.data[i]
+
+    def gather(self, positions):
+        data = self.data
+        if positions is None:
+            return data.tolist()
+        return [data[p] for p in positions]
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+
+def _date_to_epoch(value):
+    """"YYYY-MM-DD" 형식의 게시일을 epoch 초로 변환 (알 수 없으면 0)"""
+    try:
+        return int(time.mktime(time.strptime(value, "%Y-%m-%d")))
+    except (TypeError, ValueError, OverflowError):
+        return 0
+
+
+class JobTable:
+    """구직 정보 레코드를 열 단위로 저장하는 읽기 전용 테이블"""
+
+    def __init__(self, columns, epochs, salary_index, positions=None):
+        """
+        Args:
+            columns (dict): 열 이름 -> 원본 열
+            epochs (array): 원본 행별 게시일 epoch 초
+            salary_index (dict): 통화 -> (정렬된 연 환산 최대 금액 배열, 같은 순서의 원본 행 번호 배열)
+            positions (array, optional): 이 테이블에 포함된 원본 행 번호 (None이면 전체 행)
+        """
+        self._columns = columns
+        self._epochs = epochs
+        self._salary_index = salary_index
+        self._positions = positions
+
+    @classmethod
+    def from_records(cls, records, found_on=None):
+        """
+        레코드(JobData, JobDataWWR, JobDataRemoteOK) 목록으로 테이블 생성
+
+        Args:
+            records (iterable): 구직 정보 레코드
+            found_on (list, optional): 레코드별 발견 출처 문자열 (기본값: 각 레코드의 source)
+        """
+        dict_columns = {name: _DictColumn() for name in DICT_COLUMNS + (FOUND_ON_COLUMN,)}
+        text_values = {name: [] for name in TEXT_COLUMNS}
+        empty_row = dict.fromkeys(FIELD_COLUMNS.values(), "")
+        for i, record in enumerate(records):
+            row = dict(empty_row)
+            for field, value in zip(record._fields, record):
+                row[FIELD_COLUMNS[field]] = value
+            dict_columns["source"].append(record.source)
+            dict_columns[FOUND_ON_COLUMN].append(record.source if found_on is None else found_on[i])
+            for name in DICT_COLUMNS[1:]:
+                dict_columns[name].append(row[name])
+            for name in TEXT_COLUMNS:
+                text_values[name].append(row[name])
+
+        columns = dict(dict_columns)
+        columns.update((name, _TextColumn(values)) for name, values in text_values.items())
+        # 게시일은 고유 값마다 한 번만 변환
+        posted = dict_columns["posted_date"]
+        epoch_of_code = [_date_to_epoch(value) for value in posted.values]
+        epochs = array("q", [epoch_of_code[code] for code in posted.codes])
+        return cls(columns, epochs, cls._add_salary_columns(columns))
+
+    @staticmethod
+    def _add_salary_columns(columns):
+        """
+        급여(없으면 보상금) 문자열을 숫자/통화/기간 열로 추가하고 통화별 연봉 정렬 인덱스 반환
+
+        문자열은 사전 인코딩 열의 고유 값마다 한 번만 파싱합니다.
+        """
+        salary, reward = columns["salary"], columns["reward"]
+        salary_info = [parse_salary(value) for value in salary.values]
+        reward_info = [parse_salary(value) for value in reward.values]
+        minimum, maximum = _NumberColumn(), _NumberColumn()
+        currency, period = _DictColumn(), _DictColumn()
+        annual = {}  # 통화 -> [(연 환산 최대 금액, 행 번호)]
+        for p, (salary_code, reward_code) in enumerate(zip(salary.codes, reward.codes)):
+            info = salary_info[salary_code] or reward_info[reward_code]
+            if info is None:
+                minimum.append(math.nan)
+                maximum.append(math.nan)
+                currency.append("")
+                period.append("")
+                continue
+            minimum.append(info.min)
+            maximum.append(info.max)
+            currency.append(info.currency or "")
+            period.append(info.period)
+            amount = info.annual_max()
+            if amount is not None and info.currency:
+                annual.setdefault(info.currency, []).append((amount, p))
+        columns.update({
+            SALARY_MIN_COLUMN: minimum,
+            SALARY_MAX_COLUMN: maximum,
+            SALARY_CURRENCY_COLUMN: currency,
+            SALARY_PERIOD_COLUMN: period,
+        })
+        index = {}
+        for code, pairs in annual.items():
+            pairs.sort()
+            index[code] = (array("d", [amount for amount, _ in pairs]), array("I", [p for _, p in pairs]))
+        return index
+
+    def _rows(self):
+        """이 테이블에 포함된 원본 행 번호 (순서대로)"""
+        return range(len(self._epochs)) if self._positions is None else self._positions
+
+    def _select(self, positions):
+        return JobTable(self._columns, self._epochs, self._salary_index, array("I", positions))
+
+    def __len__(self):
+        return len(self._epochs) if self._positions is None else len(self._positions)
+
+    def _record(self, p):
+        columns = self._columns
+        kind = RECORD_TYPES[columns["source"].get(p)]
+        return kind._make(columns[FIELD_COLUMNS[field]].get(p) for field in kind._fields)
+
+    def __getitem__(self, key):
+        """정수 인덱스는 레코드, 슬라이스는 새 JobTable 반환"""
+        rows = self._rows()
+        if isinstance(key, slice):
+            return self._select(rows[key])
+        return self._record(rows[key])
+
+    def __iter__(self):
+        for p in self._rows():
+            yield self._record(p)
+
+    def __repr__(self):
+        return f"JobTable({len(self)} rows)"
+
+    def take(self, indices):
+        """이 테이블의 행 번호(0부터) 순서대로 새 JobTable 생성"""
+        rows = self._rows()
+        return self._select(rows[i] for i in indices)
+
+    def values(self, name):
+        """열 하나의 값 목록"""
+        if name == EPOCH_COLUMN:
+            return [self._epochs[p] for p in self._rows()]
+        return self._columns[name].gather(self._positions)
+
+    def where(self, name, predicate):
+        """
+        열 값이 조건을 만족하는 행만 담은 새 JobTable 반환
+
+        사전 인코딩 열은 고유 값마다 조건을 한 번만 평가하고 행은 정수 코드로만 비교합니다.
+        name이 "posted_epoch"이면 epoch 초 값에 조건을 적용합니다.
+        """
+        rows = self._rows()
+        if name == EPOCH_COLUMN:
+            epochs = self._epochs
+            return self._select(p for p in rows if predicate(epochs[p]))
+        column = self._columns[name]
+        if isinstance(column, _DictColumn):
+            matching = {code for code, value in enumerate(column.values) if predicate(value)}
+            codes = column.codes
+            return self._select(p for p in rows if codes[p] in matching)
+        return self._select(p for p, value in zip(rows, column.gather(self._positions)) if predicate(value))
+
+    def filter(self, **equals):
+        """열 값이 모두 일치하는 행만 담은 새 JobTable 반환 (예: table.filter(source="wwr"))"""
+        table = self
+        for name, expected in equals.items():
+            table = table.where(name, lambda value, expected=expected: value == expected)
+        return table
+
+    def salary_at_least(self, amount, currency="USD"):
+        """
+        연 환산 최대 급여가 amount 이상인 행만 담은 새 JobTable 반환 (테이블 순서 유지)
+
+        통화별 정렬 인덱스에서 이진 탐색으로 경계를 찾으므로 전체 행을 훑지 않습니다.
+        통화가 다르거나 연봉으로 환산할 수 없는 급여(합격 보상금 등), 급여 정보가 없는 행은 제외합니다.
+        """
+        keys, positions = self._salary_index.get(currency, ((), ()))
+        matched = positions[bisect_left(keys, amount):]
+        if self._positions is None:
+            return self._select(sorted(matched))
+        matched = set(matched)
+        return self._select(p for p in self._positions if p in matched)
+
+    def sort_by(self, name, reverse=False):
+        """열 값 순서로 정렬한 새 JobTable 반환 (같은 값의 행은 기존 순서 유지, 숫자 열의 NaN은 가장 작은 값)"""
+        if name == EPOCH_COLUMN:
+            keys = self._epochs
+        else:
+            column = self._columns[name]
+            if isinstance(column, _TextColumn):
+                order = sorted(zip(column.gather(self._positions), self._rows()), key=lambda pair: pair[0],
+                               reverse=reverse)
+                return self._select(p for _, p in order)
+            if isinstance(column, _NumberColumn):
+                keys = [-math.inf if math.isnan(value) else value for value in column.data]
+            else:
+                # 고유 값만 정렬해 코드별 순위를 만든 뒤 행은 순위로 정렬
+                rank = [0] * len(column.values)
+                for position, code in enumerate(sorted(range(len(column.values)), key=column.values.__getitem__)):
+                    rank[code] = position
+                keys = [rank[code] for code in column.codes]
+        return self._select(sorted(self._rows(), key=keys.__getitem__, reverse=reverse))
+
+    def record_types(self):
+        """테이블에 들어 있는 레코드 클래스 목록 (처음 나온 순서)"""
+        source = self._columns["source"]
+        codes = source.codes
+        present = set(codes) if self._positions is None else {codes[p] for p in self._positions}
+        return [RECORD_TYPES[value] for code, value in enumerate(source.values) if code in present]
+
+    def export_rows(self):
+        """
+        내보내기용 (헤더, 행 이터레이터) 반환
+
+        열마다 값 목록을 한 번에 만든 뒤 zip으로 행 튜플을 만듭니다. 출처가 하나면 그 레코드 클래스의
+        헤더를, 여러 출처가 섞여 있으면 맨 앞에 Source 열을 두고 필드를 테이블 열 기준으로 합친
+        통합 헤더(merged_columns)를 사용하며 해당 출처에 없는 열은 빈 문자열로 채웁니다.
+        """
+        kinds = self.record_types()
+        if len(kinds) <= 1:
+            if not kinds:
+                return [], iter(())
+            kind = kinds[0]
+            return kind.get_headers(), zip(*(self.values(FIELD_COLUMNS[field]) for field in kind._fields))
+
+        merged = merged_columns(kinds)
+        sources = self.values("source")
+        columns = [sources]
+        for _, name in merged:
+            owned = {kind.source for kind in kinds if any(FIELD_COLUMNS[field] == name for field in kind._fields)}
+            values = self.values(name)
+            if len(owned) < len(kinds):
+                values = [value if source in owned else "" for value, source in zip(values, sources)]
+            columns.append(values)
+        return ["Source"] + [header for header, _ in merged], zip(*columns)
+
+    def nbytes(self):
+        """열 데이터가 차지하는 대략적인 바이트 수 (고유 값 문자열은 UTF-8 길이로 계산)"""
+        size = sum(column.nbytes() for column in self._columns.values()) + self._epochs.itemsize * len(self._epochs)
+        size += sum(keys.itemsize * len(keys) + rows.itemsize * len(rows) for keys, rows in self._salary_index.values())
+        if self._positions is not None:
+            size += self._positions.itemsize * len(self._positions)
+        return size
@@ -0,0 +1,129 @@
+"""
+급여 문자열을 숫자 범위로 정규화하는 모듈
+
+출처마다 급여는 자유 형식 문자열로만 제공됩니다.
+- RemoteOK: "💰 $70k - $120k", "💰 $90k", "💰 $40 - $60 /hr"
+- WWR: "Not specified"
+- Wanted: "합격보상금 100만원" (연봉이 아닌 합격 보상금), "보상금 정보 없음"
+
+parse_salary()는 이 문자열에서 최소/최대 금액, 통화, 기간을 한 번 추출합니다. 통화나 급여 문맥(💰, salary, 연봉,
+보상금, /hr 등)이 없는 숫자("10-20 employees")와 해석할 수 없는 금액("$1.2.3k")은 급여로 보지 않습니다. 연봉 비교에는
+annual_max()로 연 단위로 환산한 상한을 사용하며, 합격 보상금처럼 급여가 아닌 금액은 환산하지 않습니다.
+"""
+import re
+from collections import namedtuple
+
+# 기간 -> 연 환산 배수 (bonus 등 여기에 없는 기간은 연봉으로 환산하지 않음)
+ANNUAL_FACTORS = {"year": 1, "month": 12, "week": 52, "day": 260, "hour": 2080}
+
+# 금액 단위 -> 배수
+UNIT_MULTIPLIERS = {"k": 1e3, "m": 1e6, "천": 1e3, "만": 1e4, "억": 1e8}
+_KOREAN_UNITS = {"천", "만", "억"}
+
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "₩": "KRW", "원": "KRW"}
+_CURRENCY_CODE = re.compile(r"\b(USD|EUR|GBP|KRW|CAD|AUD)\b", re.I)
+
+# 기간 판별 패턴 (앞에서부터 처음 일치하는 기간 사용, 없으면 연봉)
+PERIOD_PATTERNS = [
+    ("bonus", re.compile(r"보상금|bonus", re.I)),
+    ("hour", re.compile(r"/\s*h(?:ou)?r\b|per\s+hour|hourly|시급", re.I)),
+    ("day", re.compile(r"/\s*day\b|per\s+day|daily|일급", re.I)),
+    ("week", re.compile(r"/\s*w(?:ee)?k\b|per\s+week|weekly|주급", re.I)),
+    ("month", re.compile(r"/\s*mo(?:nth)?\b|per\s+month|monthly|월급", re.I)),
+]
+
+# 급여 문자열로 판단하는 문맥 (통화나 기간 표현이 없을 때)
+_SALARY_CONTEXT = re.compile(r"💰|salary|compensation|\bpay\b|급여|연봉|월급|보상금", re.I)
+
+# 금액 - ".5k"처럼 숫자 중간부터 시작하는 일치는 제외
+_AMOUNT = re.compile(r"(?<![\d.,])(\d+(?:[.,]\d+)*)\s*(k|m|천|만|억)?(?![a-z])", re.I)
+_SEPARATOR = re.compile(r"[.,]")
+_RANGE_SEPARATOR = re.compile(r"\s*(?:-|–|—|~|\bto\b)\s*", re.I)
+
+
+class Salary(namedtuple("Salary", ["min", "max", "currency", "period"])):
+    """정규화한 급여 (최소 금액, 최대 금액, 통화 코드 또는 None, 기간)"""
+
+    __slots__ = ()
+
+    def annual_max(self):
+        """연 단위로 환산한 최대 금액 (연봉으로 환산할 수 없는 기간이면 None)"""
+        factor = ANNUAL_FACTORS.get(self.period)
+        return self.max * factor if factor else None
+
+
+def _to_number(digits, unit):
+    """
+    숫자 문자열과 단위로 금액 계산 (해석할 수 없으면 ValueError)
+
+    - "120,000", "50.000", "1.234.567": 뒤 그룹이 모두 3자리이면 자릿수 구분 기호
+      (단, "1.500k"처럼 단위가 붙은 점 하나는 소수점)
+    - "1,234.56", "1.234,56": 마지막 기호만 다르면 소수점, 앞의 기호는 자릿수 구분
+    - "1.5k", "1,5k": 기호가 하나이면 소수점
+    """
+    separators = _SEPARATOR.findall(digits)
+    groups = _SEPARATOR.split(digits)
+    if not separators:
+        value = float(digits)
+    elif (len(set(separators)) == 1 and all(len(group) == 3 for group in groups[1:])
+            and (len(separators) > 1 or separators[0] == "," or not unit)):
+        value = float("".join(groups))
+    elif len(separators) == 1 or (separators[-1] not in separators[:-1] and len(set(separators[:-1])) == 1
+                                  and all(len(group) == 3 for group in groups[1:-1])):
+        value = float(f"{''.join(groups[:-1])}.{groups[-1]}")
+    else:
+        raise ValueError(f"해석할 수 없는 금액: {digits}")
+    return value * UNIT_MULTIPLIERS.get((unit or "").lower(), 1)
+
+
+def _side_amount(text):
+    """범위의 한쪽 문자열에서 금액 추출 ("1억 2000만"처럼 한국어 단위가 이어지면 합산)"""
+    matches = _AMOUNT.findall(text)
+    if not matches:
+        return None
+    if len(matches) > 1 and all(unit in _KOREAN_UNITS for _, unit in matches):
+        return sum(_to_number(digits, unit) for digits, unit in matches)
+    return _to_number(*matches[0])
+
+
+def _currency(text):
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in text:
+            return code
+    match = _CURRENCY_CODE.search(text)
+    return match.group(1).upper() if match else None
+
+
+def parse_salary(text):
+    """
+    급여 문자열을 Salary로 변환 (금액이 없거나, 급여 문맥이 없거나, 금액을 해석할 수 없으면 None)
+
+    Examples:
+        "💰 $70k - $120k" -> Salary(70000.0, 120000.0, "USD", "year")
+        "합격보상금 100만원" -> Salary(1000000.0, 1000000.0, "KRW", "bonus")
+        "10-20 employees" -> None
+    """
+    if not text:
+        return None
+    currency = _currency(text)
+    period = next((name for name, pattern in PERIOD_PATTERNS if pattern.search(text)), None)
+    if currency is None and period is None and not _SALARY_CONTEXT.search(text):
+        return None
+
+    parts = _RANGE_SEPARATOR.split(text, maxsplit=1)
+    try:
+        low = _side_amount(parts[0])
+        high = _side_amount(parts[1]) if len(parts) > 1 else None
+        if low is None and high is None:
+            return None
+        if low is None or high is None:
+            low = high = low if low is not None else high
+        else:
+            # "$70 - 120k"처럼 단위를 뒤에만 쓴 경우 앞 금액에도 같은 단위 적용
+            low_digits, low_unit = _AMOUNT.search(parts[0]).groups()
+            high_unit = _AMOUNT.search(parts[1]).group(2)
+            if high_unit and not low_unit:
+                low = _to_number(low_digits, high_unit)
+    except ValueError:
+        return None
+    return Salary(min(low, high), max(low, high), currency, period or "year")
@@ -1,22 +1,103 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-import time
+import os
+import re
+from urllib.parse import urljoin
 import csv
+from bs4 import SoupStrainer
 from utils.logger import setup_logger
+from utils.browser_pool import get_browser_pool
+from utils.html_parser import parse_html
+from utils.parse_pool import get_parse_pool
+from utils.http_session import get_http_client
+from utils.progress import FETCHING, PARSING, report_phase
+from utils.rate_limiter import get_rate_limiter
+from utils.scroll_loader import DEFAULT_DEADLINE, scroll_until_stable, wait_for_items
+from utils.resource_blocker import WANTED_BLOCK_PROFILE, install_resource_blocker, is_blocking_enabled, log_page_stats
+from extractors.card_spec import CardSpec, Field
+from extractors.errors import ScrapeFailedError
 from extractors.job_data import JobData
 
 # 로거 설정
 logger = setup_logger(__name__)
 
+# 채용 공고 카드 선택자 (클래스명이 'JobCard_container'로 시작)
+JOB_CARD_SELECTOR = 'div[class*="JobCard_container"]'
+
+# 부분 파싱 대상: 채용 공고 카드만 트리로 생성
+JOB_CARD_CLASS = re.compile(r"^JobCard_container")
+JOB_CARD_STRAINER = SoupStrainer("div", class_=JOB_CARD_CLASS)
+
+# 채용 공고 카드 필드 추출 명세 (카드당 한 번의 순회로 모든 필드 추출)
+JOB_CARD_SPEC = CardSpec(
+    link=Field("a", attr="href"),
+    title=Field("strong", class_prefix="JobCard_title", default="제목 없음"),
+    company_name=Field("span", class_prefix="JobCard_companyName", default="회사명 없음"),
+    reward=Field("span", class_prefix="JobCard_reward", default="보상금 정보 없음"),
+)
+
+# 검색 결과 페이지가 내부적으로 호출하는 채용 공고 JSON API
+DEFAULT_API_URL = "https://www.wanted.co.kr/api/v4/jobs"
+
+
+def _card_to_job(card):
+    """채용 공고 카드 하나를 JobData 레코드로 변환 (a 요소가 없는 카드는 None, href가 없으면 빈 링크)"""
+    fields = JOB_CARD_SPEC.extract(card)
+    partial_link = fields["link"]
+    if partial_link is None:
+        return None
+    link = f"https://www.wanted.co.kr{partial_link}" if partial_link.startswith("/") else partial_link
+
+    logger.debug(f"채용 정보 추출: {fields['title']} - {fields['company_name']}")
+    return JobData(fields["title"], fields["company_name"], fields["reward"], link).interned()
+
+
+def parse_listing(content):
+    """
+    검색 결과 페이지 HTML을 파싱해 채용 공고 행 목록 반환
+
+    파싱 프로세스 풀의 워커에서 실행될 수 있도록 모듈 최상위 함수로 정의합니다.
+    """
+    soup = parse_html(content, parse_only=JOB_CARD_STRAINER)
+
+    # 클래스명이 'JobCard_container'로 시작하는 모든 div 요소 찾기
+    cards = soup.find_all("div", class_=JOB_CARD_CLASS)
+    logger.info(f"{len(cards)}개의 채용 공고 요소 발견")
+
+    jobs_db = []
+    for card in cards:
+        try:
+            job = _card_to_job(card)
+            if job is not None:
+                jobs_db.append(job)
+        except Exception as e:
+            logger.error(f"작업 추출 중 오류 발생: {e}")
+    return jobs_db
+
+
 class WantedJobSearch:
     """
     Wanted 웹사이트에서 구직 정보를 스크래핑하는 클래스
     """
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, fetch_mode=None):
+        """
+        Args:
+            headless (bool): 브라우저 헤드리스 모드 여부
+            fetch_mode (str, optional): "api" (검색 JSON API 우선, 실패 시 브라우저) 또는
+                "browser" (항상 브라우저). 기본값은 WANTED_FETCH_MODE 환경 변수 또는 "api"
+        """
         self.keywords = []
         self.base_url = "https://www.wanted.co.kr/search?query={}&tab=position"
         self.headless = headless
-        logger.info(f"WantedJobSearch 초기화: headless 모드 = {self.headless}")
+        self.fetch_mode = fetch_mode or os.getenv("WANTED_FETCH_MODE", "api")
+        # 검색 JSON API 설정
+        self.api_url = os.getenv("WANTED_API_URL", DEFAULT_API_URL)
+        self.api_page_size = 20
+        self.api_max_pages = 5
+        self.http = get_http_client("wanted")
+        # 기본 컨텍스트 설정
+        self.context_options = {'viewport': {'width': 1920, 'height': 1080}}
+        # 첫 카드가 나타날 때까지 기다리는 최대 시간 (초)
+        self.first_card_timeout = 10
+        logger.info(f"WantedJobSearch 초기화: headless 모드 = {self.headless}, 수집 방식 = {self.fetch_mode}")
 
     def add_keyword(self, keyword):
         """단일 키워드 추가"""
@@ -28,46 +109,61 @@ class WantedJobSearch:
         for keyword in keywords:
             self.add_keyword(keyword)
 
-    def run_playwright(self, url, scroll_count=5, scroll_delay=1.5, max_retries=3):
-        """Playwright를 사용하여 웹 페이지 콘텐츠 가져오기"""
+    def _load_page(self, page, url, scroll_count, scroll_delay, scroll_deadline):
+        """페이지를 열고 스크롤한 뒤 HTML 콘텐츠 반환 (브라우저 풀 스레드에서 실행)"""
+        # 이미지, 폰트, 스타일시트, 분석 스크립트 요청 차단
+        block_stats = None
+        if is_blocking_enabled():
+            block_stats = install_resource_blocker(page, WANTED_BLOCK_PROFILE)
+        
+        # 페이지 로드 - 첫 채용 공고 카드가 나타날 때까지 대기
+        logger.info(f"페이지 로드 중: {url}")
+        page.goto(url)
+        if not wait_for_items(page, JOB_CARD_SELECTOR, timeout=self.first_card_timeout) and self._check_for_bot_detection(page):
+            raise ScrapeFailedError(f"봇 감지 페이지가 표시되었습니다: {url}", captcha=True)
+        
+        # 카드 수가 더 늘지 않을 때까지 스크롤
+        logger.info("페이지 스크롤 시작")
+        scroll_until_stable(page, JOB_CARD_SELECTOR, max_scrolls=scroll_count, step_timeout=scroll_delay,
+                            deadline=scroll_deadline)
+        
+        # 콘텐츠 추출
+        content = page.content()
+        if block_stats:
+            log_page_stats(WANTED_BLOCK_PROFILE, block_stats)
+        return content
+
+    def run_playwright(self, url, scroll_count=5, scroll_delay=1.5, max_retries=3, scroll_deadline=DEFAULT_DEADLINE):
+        """
+        Playwright를 사용하여 웹 페이지 콘텐츠 가져오기
+        
+        scroll_count는 최대 스크롤 횟수, scroll_delay는 스크롤마다 새 카드를 기다리는
+        최대 시간(초)이며, 카드 수가 더 늘지 않으면 즉시 스크롤을 멈춥니다.
+        """
+        # 공유 브라우저 풀에서 페이지를 빌려 사용
+        pool = get_browser_pool("wanted", headless=self.headless)
+        limiter = get_rate_limiter(url)
         for attempt in range(max_retries):
             try:
-                with sync_playwright() as p:
-                    # 기본 브라우저 설정
-                    browser = p.chromium.launch(
-                        headless=self.headless
-                    )
-                    
-                    # 기본 컨텍스트 설정
-                    context = browser.new_context(
-                        viewport={'width': 1920, 'height': 1080}
-                    )
-                    
-                    # 새 페이지 생성
-                    page = context.new_page()
-                    
-                    # 페이지 로드
-                    logger.info(f"페이지 로드 중: {url}")
-                    page.goto(url)
-                    time.sleep(2)
-                    
-                    # 스크롤 다운
-                    logger.info("페이지 스크롤 시작")
-                    for i in range(scroll_count):
-                        # 페이지 끝까지 스크롤
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                        time.sleep(scroll_delay)
-                    
-                    # 콘텐츠 추출
-                    content = page.content()
-                    browser.close()
-                    return content
-                    
+                # 속도 제한 대기는 브라우저 슬롯을 잡기 전에 수행 (대기 중에 슬롯을 놀리지 않도록)
+                limiter.acquire()
+                content = pool.run(
+                    lambda page: self._load_page(page, url, scroll_count, scroll_delay, scroll_deadline),
+                    context_options=self.context_options
+                )
+                limiter.on_success()
+                return content
+            except ScrapeFailedError:
+                # 봇 감지 페이지는 재시도해도 같은 결과이므로 바로 중단
+                logger.error("봇 감지로 인해 차단됨 - 재시도하지 않음")
+                limiter.on_throttle()
+                raise
             except Exception as e:
                 logger.error(f"Playwright 실행 중 오류 발생 (시도 {attempt+1}/{max_retries}): {e}")
+                # 실패 시 도메인 요청 속도를 낮추고, 대기는 다음 접속 시 속도 제한기가 처리
+                limiter.on_throttle()
                 if attempt < max_retries - 1:
-                    logger.info("5초 후 재시도...")
-                    time.sleep(5)
+                    logger.info("재시도...")
                 else:
                     return None
         
@@ -93,40 +189,71 @@ class WantedJobSearch:
                 
         return False
         
-    def _scroll_page(self, page, scroll_count, scroll_delay):
-        """페이지를 자연스럽게 스크롤하는 메서드"""
-        for i in range(scroll_count):
-            # 페이지 높이 확인
-            height = page.evaluate("document.body.scrollHeight")
-            viewport_height = page.evaluate("window.innerHeight")
-            
-            # 자연스러운 스크롤을 위한 랜덤 요소 추가
-            scroll_amount = min(height, viewport_height * (i + 1))
+    def _api_item_to_job(self, item):
+        """검색 API의 채용 공고 항목을 JobData 레코드로 변환"""
+        title = (item.get("position") or "").strip() or "제목 없음"
+        company = item.get("company") or {}
+        company_name = (company.get("name") or "").strip() or "회사명 없음"
+        reward_info = item.get("reward") or {}
+        reward = (reward_info.get("formatted_total") or "").strip() or "보상금 정보 없음"
+        link = f"https://www.wanted.co.kr/wd/{item['id']}"
+        return JobData(title, company_name, reward, link).interned()
+
+    def fetch_from_api(self, keyword):
+        """
+        Wanted 검색 JSON API에서 페이지를 따라가며 구직 정보 가져오기 (브라우저 사용 안 함)
+        
+        Raises:
+            requests.RequestException: 요청 실패
+            ValueError: 응답이 예상한 JSON 형식이 아닌 경우
+        """
+        jobs_db = []
+        url = self.api_url
+        params = {"query": keyword, "limit": self.api_page_size, "offset": 0}
+        
+        for _ in range(self.api_max_pages):
+            report_phase(FETCHING)
+            response = self.http.get(url, params=params, headers={"Accept": "application/json"})
+            if response.status_code != 200:
+                raise ValueError(f"검색 API 응답 오류: {response.status_code}")
             
-            # 드래그하듯이 스크롤 (더 자연스러움)
-            for step in range(10):
-                current_pos = page.evaluate("window.scrollY")
-                target_pos = scroll_amount * (step + 1) / 10
-                distance = target_pos - current_pos
-                
-                if distance > 0:
-                    page.evaluate(f"window.scrollBy(0, {distance/10})")
-                    # 불규칙한 지연으로 자연스러움 향상
-                    time.sleep(0.02 + 0.01 * (step % 3))
+            payload = response.json()
+            items = payload.get("data")
+            if not isinstance(items, list):
+                raise ValueError("검색 API 응답에 data 목록이 없습니다")
             
-            # 잠시 콘텐츠 탐색하는 것처럼 일시 정지
-            time.sleep(scroll_delay)
+            report_phase(PARSING)
+            for item in items:
+                jobs_db.append(self._api_item_to_job(item))
             
-            # 가끔 작은 위/아래 스크롤 추가 (실제 사용자처럼)
-            if i % 2 == 1:
-                page.evaluate("window.scrollBy(0, -100)")
-                time.sleep(0.3)
-                page.evaluate("window.scrollBy(0, 120)")
-                time.sleep(0.2)
-    
+            # 다음 페이지 링크가 없거나 결과가 비어 있으면 종료
+            next_link = (payload.get("links") or {}).get("next")
+            if not items or not next_link:
+                break
+            url = urljoin(self.api_url, next_link)
+            params = None
+        
+        return jobs_db
+
     def scrape_keyword(self, keyword):
-        """특정 키워드에 대한 구직 정보 스크래핑"""
-        jobs_db = []
+        """특정 키워드에 대한 구직 정보 스크래핑 (API 우선, 실패 시 브라우저 사용)"""
+        if self.fetch_mode == "api":
+            try:
+                jobs_db = self.fetch_from_api(keyword)
+                logger.info(f"Wanted 검색 API에서 키워드 '{keyword}'에 대해 {len(jobs_db)}개 작업 가져옴")
+                return jobs_db
+            except Exception as e:
+                logger.warning(f"Wanted 검색 API 실패, 브라우저로 대체합니다 ({keyword}): {e}")
+        
+        return self.scrape_keyword_with_browser(keyword)
+
+    def scrape_keyword_with_browser(self, keyword):
+        """
+        Playwright로 검색 페이지를 렌더링하여 구직 정보 스크래핑
+        
+        Raises:
+            ScrapeFailedError: 페이지를 가져오지 못했거나 봇 감지로 차단된 경우
+        """
         url = self.base_url.format(keyword)
         
         logger.info(f"Wanted 스크래핑 시작: URL = {url}")
@@ -134,46 +261,10 @@ class WantedJobSearch:
         content = self.run_playwright(url)
         if not content:
             logger.warning(f"키워드 '{keyword}'에 대한 콘텐츠를 가져오지 못했습니다.")
-            return jobs_db
+            raise ScrapeFailedError(f"Wanted 검색 페이지를 가져오지 못했습니다: {url}")
             
-        soup = BeautifulSoup(content, "html.parser")
-        
-        # 클래스명이 'JobCard_container'로 시작하는 모든 div 요소 찾기
-        jobs = soup.find_all("div", class_=lambda x: x and x.startswith("JobCard_container"))
-        
-        logger.info(f"{len(jobs)}개의 채용 공고 요소 발견")
-        
-        for job in jobs:
-            try:
-                # a 태그 찾기 (링크)
-                link_element = job.find("a")
-                if not link_element:
-                    continue
-                    
-                partial_link = link_element.get("href", "")
-                link = f"https://www.wanted.co.kr{partial_link}" if partial_link.startswith("/") else partial_link
-                
-                # 제목 찾기 - 클래스명이 'JobCard_title'로 시작하는 strong 태그
-                title_element = job.find(lambda tag: tag.name == "strong" and tag.get('class') and any(c.startswith("JobCard_title") for c in tag.get('class', [])))
-                title = title_element.text.strip() if title_element else "제목 없음"
-                
-                # 회사명 찾기 - 클래스명이 'JobCard_companyName'으로 시작하는 span 태그
-                company_element = job.find(lambda tag: tag.name == "span" and tag.get('class') and any(c.startswith("JobCard_companyName") for c in tag.get('class', [])))
-                company_name = company_element.text.strip() if company_element else "회사명 없음"
-                
-                # 보상금 찾기 - 클래스명이 'JobCard_reward'로 시작하는 span 태그
-                reward_element = job.find(lambda tag: tag.name == "span" and tag.get('class') and any(c.startswith("JobCard_reward") for c in tag.get('class', [])))
-                reward = reward_element.text.strip() if reward_element else "보상금 정보 없음"
-                
-                # 디버깅 로그 추가
-                logger.info(f"채용 정보 추출: {title} - {company_name}")
-                
-                job_data = JobData(title, company_name, link, reward=reward)
-                jobs_db.append(job_data.to_list())
-            except Exception as e:
-                logger.error(f"작업 추출 중 오류 발생: {e}")
-
-        return jobs_db
+        report_phase(PARSING)
+        return get_parse_pool().run(parse_listing, content)
 
     def save_to_csv(self, keyword):
         """스크래핑한 구직 정보를 CSV 파일로 저장"""
@@ -187,11 +278,8 @@ class WantedJobSearch:
                     
                 with open(f"wanted_{keyword}_jobs.csv", mode="w", encoding="utf-8") as file:
                     writer = csv.writer(file)
-                    # 첫 번째 작업에서 JobData 인스턴스를 생성하여 헤더 가져오기
-                    job_data = JobData(keyword_jobs[0][0], keyword_jobs[0][1], keyword_jobs[0][-1], reward=keyword_jobs[0][2])
-                    writer.writerow(job_data.get_headers())
-                    for job in keyword_jobs:
-                        writer.writerow(job)
+                    writer.writerow(JobData.HEADERS)
+                    writer.writerows(keyword_jobs)
                 logger.info(f"키워드 '{keyword}'에 대한 {len(keyword_jobs)}개 작업이 CSV 파일에 저장되었습니다")
             except Exception as e:
                 logger.error(f"CSV 저장 중 오류 발생 (키워드 '{keyword}'): {e}")
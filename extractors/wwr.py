@@ -1,13 +1,124 @@
-import requests
 import csv
 import logging
-from bs4 import BeautifulSoup
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bs4 import SoupStrainer
+from extractors.errors import ScrapeFailedError
 from extractors.job_data_wwr import JobDataWWR
+from utils.http_session import get_http_client
+from utils.html_parser import parse_html
+from utils.http_cache import get_http_cache
+from utils.parse_pool import get_parse_pool
+from utils.progress import PARSING, report_phase
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 전체 목록 크롤링 시 기본 동시 요청 수
+DEFAULT_CRAWL_CONCURRENCY = 4
+
+# 부분 파싱 대상: 채용 공고 섹션(section.jobs)과 페이지네이션(div.pagination)만 트리로 생성
+LISTING_STRAINER = SoupStrainer(["section", "div"], class_=["jobs", "pagination"])
+
+
+def _extract_job_data(job):
+    """job HTML 요소에서 job 데이터 추출"""
+    try:
+        title = job.find("h4", class_="new-listing__header__title")
+        company = job.find("p", class_="new-listing__company-name")
+        region = job.find("p", class_="new-listing__company-headquarters")
+        url_element = job.find("div", class_="tooltip--flag-logo")
+
+        if not all([title, company, region, url_element]):
+            logger.warning("HTML 구조 일부 요소 누락")
+            return None
+
+        # 제목, 회사, 지역 추출
+        title_text = title.text.strip()
+        company_text = company.text.strip()
+        region_text = region.text.strip()
+
+        # 링크 추출
+        link = job.a['href'] if job.a else None
+        if not link:
+            link = url_element.next_sibling['href'] if url_element.next_sibling else None
+
+        if not link:
+            logger.warning("링크를 찾을 수 없습니다")
+            return None
+
+        if not link.startswith("http"):
+            link = f"https://weworkremotely.com{link}"
+
+        # 급여 정보는 없으므로 "Not specified" 사용
+        salary = "Not specified"
+
+        return JobDataWWR(title_text, company_text, region_text, salary, link).interned()
+
+    except Exception as e:
+        logger.error(f"작업 데이터 추출 중 오류 발생: {e}")
+        return None
+
+
+def _get_jobs_from_soup(soup):
+    """BeautifulSoup 객체에서 job 목록 추출 (업데이트된 HTML 구조)"""
+    all_jobs = []
+    try:
+        # 모든 job 섹션 찾기
+        job_sections = soup.find_all("section", class_="jobs")
+
+        if not job_sections:
+            logger.warning("jobs 섹션을 찾을 수 없습니다")
+            return all_jobs
+
+        # 각 섹션별로 작업 추출
+        for section in job_sections:
+            section_name = ""
+            section_header = section.find("h2")
+            if section_header and section_header.a:
+                section_name = section_header.a.text.strip()
+
+            logger.info(f"섹션 처리 중: {section_name}")
+
+            # 섹션 내 모든 리스트 항목 찾기
+            job_elements = section.find_all("li")
+
+            for job in job_elements:
+                # 'view-all' 클래스가 있는 항목 건너뛰기
+                if job.get("class") and ("view-all" in job.get("class") or "feature--ad" in job.get("class")):
+                    continue
+
+                job_data = _extract_job_data(job)
+                if job_data:
+                    all_jobs.append(job_data)
+
+    except Exception as e:
+        logger.error(f"작업 목록 추출 중 오류 발생: {e}")
+
+    return all_jobs
+
+
+def _count_pages(soup):
+    """페이지네이션 영역에서 전체 페이지 수 계산"""
+    pagination = soup.find("div", class_="pagination")
+    if not pagination:
+        return 1
+
+    pages = pagination.find_all("span", class_="page")
+    return len(pages) if pages else 1
+
+
+def parse_listing(content):
+    """
+    목록 페이지 HTML을 파싱해 {"jobs": 작업 목록, "pages": 페이지 수} 반환
+
+    파싱 프로세스 풀의 워커에서 실행될 수 있도록 모듈 최상위 함수로 정의합니다.
+    """
+    soup = parse_html(content, parse_only=LISTING_STRAINER)
+    return {"jobs": _get_jobs_from_soup(soup), "pages": _count_pages(soup)}
+
+
 class WWRJobSearch:
     """
     We Work Remotely 웹사이트에서 구직 정보를 스크래핑하는 클래스
@@ -17,6 +128,10 @@ class WWRJobSearch:
         self.keywords = []
         self.base_url = "https://weworkremotely.com/remote-jobs/search?&term="
         self.jobs_page_url = "https://weworkremotely.com/remote-full-time-jobs?page={}"
+        # keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트
+        self.http = get_http_client("wwr")
+        # ETag/Last-Modified 기반 조건부 GET 캐시 (비활성화 시 None)
+        self.cache = get_http_cache("wwr")
 
     def add_keyword(self, keyword):
         """단일 키워드 추가"""
@@ -28,103 +143,41 @@ class WWRJobSearch:
         for keyword in keywords:
             self.add_keyword(keyword)
 
-    def _extract_job_data(self, job):
-        """job HTML 요소에서 job 데이터 추출"""
-        try:
-            title = job.find("h4", class_="new-listing__header__title")
-            company = job.find("p", class_="new-listing__company-name")
-            region = job.find("p", class_="new-listing__company-headquarters")
-            categories_div = job.find("div", class_="new-listing__categories")
-            url_element = job.find("div", class_="tooltip--flag-logo")
-
-            if not all([title, company, region, url_element]):
-                logger.warning("HTML 구조 일부 요소 누락")
-                return None
-
-            # 제목, 회사, 지역 추출
-            title_text = title.text.strip()
-            company_text = company.text.strip()
-            region_text = region.text.strip()
-            
-            # 모든 카테고리 태그 추출
-            categories = []
-            if categories_div:
-                category_elements = categories_div.find_all("p", class_="new-listing__categories__category")
-                categories = [cat.text.strip() for cat in category_elements if cat.text.strip()]
-            
-            # 링크 추출
-            link = job.a['href'] if job.a else None
-            if not link:
-                link = url_element.next_sibling['href'] if url_element.next_sibling else None
-            
-            if not link:
-                logger.warning("링크를 찾을 수 없습니다")
-                return None
-                
-            if not link.startswith("http"):
-                link = f"https://weworkremotely.com{link}"
-                
-            # 급여 정보는 없으므로 "Not specified" 사용
-            salary = "Not specified"
-                
-            job_data = JobDataWWR(title_text, company_text, region_text, salary, link, categories)
-            return job_data
-            
-        except Exception as e:
-            logger.error(f"작업 데이터 추출 중 오류 발생: {e}")
+    def _fetch_listing(self, url):
+        """
+        목록 페이지를 요청해 {"jobs": 작업 목록, "pages": 페이지 수} 반환 (요청 실패 시 None)
+        
+        캐시에 검증자가 있으면 조건부 GET을 보내고, 304 응답이면 파싱 없이 저장된 결과를 재사용합니다.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        headers = entry.validator_headers() if entry and entry.data is not None else {}
+        
+        response = self.http.get(url, headers=headers)
+        if response.status_code == 304 and headers:
+            self.cache.touch(url)
+            logger.info(f"304 Not Modified - 캐시된 결과 사용: {url}")
+            # 디스크 캐시는 JSON이므로 행 리스트를 레코드로 되돌림
+            return {"jobs": [JobDataWWR._make(job).interned() for job in entry.data["jobs"]], "pages": entry.data["pages"]}
+        if response.status_code != 200:
+            logger.warning(f"페이지 요청 실패: {response.status_code} - {url}")
             return None
-
-    def _get_jobs_from_soup(self, soup):
-        """BeautifulSoup 객체에서 job 목록 추출 (업데이트된 HTML 구조)"""
-        all_jobs = []
-        try:
-            # 모든 job 섹션 찾기
-            job_sections = soup.find_all("section", class_="jobs")
-            
-            if not job_sections:
-                logger.warning("jobs 섹션을 찾을 수 없습니다")
-                return all_jobs
-            
-            # 각 섹션별로 작업 추출
-            for section in job_sections:
-                section_name = ""
-                section_header = section.find("h2")
-                if section_header and section_header.a:
-                    section_name = section_header.a.text.strip()
-                
-                logger.info(f"섹션 처리 중: {section_name}")
-                
-                # 섹션 내 모든 리스트 항목 찾기
-                job_elements = section.find_all("li")
-                
-                for job in job_elements:
-                    # 'view-all' 클래스가 있는 항목 건너뛰기
-                    if job.get("class") and ("view-all" in job.get("class") or "feature--ad" in job.get("class")):
-                        continue
-                    
-                    job_data = self._extract_job_data(job)
-                    if job_data:
-                        # 섹션 이름 추가
-                        job_data.section = section_name
-                        all_jobs.append(job_data.to_list())
-                    
-        except Exception as e:
-            logger.error(f"작업 목록 추출 중 오류 발생: {e}")
             
-        return all_jobs
+        report_phase(PARSING)
+        listing = get_parse_pool().run(parse_listing, response.content)
+        if self.cache:
+            self.cache.put(url, response, listing)
+        return listing
 
     def scrape_page(self, url):
         """특정 URL의 페이지에서 구직 정보 스크래핑"""
         logger.info(f"WWR 페이지 스크래핑 시작: URL = {url}")
         
         try:
-            response = requests.get(url)
-            if response.status_code != 200:
-                logger.warning(f"페이지 요청 실패: {response.status_code} - {url}")
+            listing = self._fetch_listing(url)
+            if listing is None:
                 return []
                 
-            soup = BeautifulSoup(response.content, "html.parser")
-            jobs = self._get_jobs_from_soup(soup)
+            jobs = listing["jobs"]
             logger.info(f"URL {url}에서 {len(jobs)}개 작업 스크래핑 완료")
             return jobs
         except Exception as e:
@@ -132,23 +185,26 @@ class WWRJobSearch:
             return []
 
     def scrape_keyword(self, keyword):
-        """특정 키워드에 대한 구직 정보 스크래핑"""
+        """
+        특정 키워드에 대한 구직 정보 스크래핑
+        
+        Raises:
+            ScrapeFailedError: 검색 페이지를 가져오지 못한 경우 (결과 0건과 구분)
+        """
         url = f"{self.base_url}{keyword}"
         logger.info(f"WWR 키워드 스크래핑 시작: URL = {url}")
         
         try:
-            response = requests.get(url)
-            if response.status_code != 200:
-                logger.warning(f"키워드 검색 요청 실패: {response.status_code} - {url}")
-                return []
-                
-            soup = BeautifulSoup(response.text, "html.parser")
-            jobs = self._get_jobs_from_soup(soup)
-            logger.info(f"키워드 '{keyword}'에 대해 {len(jobs)}개 작업 스크래핑 완료")
-            return jobs
+            listing = self._fetch_listing(url)
         except Exception as e:
             logger.error(f"키워드 스크래핑 중 오류 발생 ({keyword}): {e}")
-            return []
+            raise ScrapeFailedError(f"WWR 검색 페이지 요청 실패: {e}") from e
+        if listing is None:
+            raise ScrapeFailedError(f"WWR 검색 페이지 요청 실패: {url}")
+            
+        jobs = listing["jobs"]
+        logger.info(f"키워드 '{keyword}'에 대해 {len(jobs)}개 작업 스크래핑 완료")
+        return jobs
 
     def get_pages(self, url=None):
         """페이지네이션 정보 가져오기"""
@@ -156,33 +212,62 @@ class WWRJobSearch:
             url = self.jobs_page_url.format(1)
             
         try:
-            response = requests.get(url)
-            if response.status_code != 200:
-                logger.warning(f"페이지네이션 정보 요청 실패: {response.status_code}")
-                return 1
-                
-            soup = BeautifulSoup(response.content, "html.parser")
-            pagination = soup.find("div", class_="pagination")
-            if not pagination:
-                return 1
-                
-            pages = pagination.find_all("span", class_="page")
-            return len(pages) if pages else 1
+            listing = self._fetch_listing(url)
+            return listing["pages"] if listing else 1
         except Exception as e:
             logger.error(f"페이지 수 확인 중 오류 발생: {e}")
             return 1
 
+    def crawl_all_pages(self, max_workers=None):
+        """
+        전체 목록의 모든 페이지를 동시에 스크래핑
+        
+        첫 페이지는 한 번만 요청하여 작업 추출과 페이지 수 계산에 함께 사용하고,
+        나머지 페이지는 최대 max_workers개씩 동시에 요청해 도착하는 대로 파싱합니다.
+        
+        Args:
+            max_workers (int, optional): 동시에 요청할 최대 페이지 수 (기본값: WWR_CRAWL_CONCURRENCY 환경 변수 또는 4)
+            
+        Returns:
+            list: 페이지 순서대로 정렬된 작업 목록
+        """
+        if max_workers is None:
+            max_workers = int(os.getenv("WWR_CRAWL_CONCURRENCY", DEFAULT_CRAWL_CONCURRENCY))
+        
+        first_url = self.jobs_page_url.format(1)
+        logger.info(f"WWR 전체 목록 크롤링 시작: URL = {first_url}")
+        try:
+            listing = self._fetch_listing(first_url)
+            if listing is None:
+                return []
+        except Exception as e:
+            logger.error(f"페이지 스크래핑 중 오류 발생 ({first_url}): {e}")
+            return []
+        
+        num_of_pages = listing["pages"]
+        pages = {1: listing["jobs"]}
+        logger.info(f"페이지 1/{num_of_pages} 스크래핑 완료: {len(pages[1])}개 작업 가져옴")
+        
+        if num_of_pages > 1:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="wwr-crawl") as executor:
+                futures = {
+                    executor.submit(self.scrape_page, self.jobs_page_url.format(page)): page
+                    for page in range(2, num_of_pages + 1)
+                }
+                for future in as_completed(futures):
+                    page = futures[future]
+                    pages[page] = future.result()
+                    logger.info(f"페이지 {page}/{num_of_pages} 스크래핑 완료: {len(pages[page])}개 작업 가져옴")
+        
+        all_jobs = []
+        for page in sorted(pages):
+            all_jobs.extend(pages[page])
+        return all_jobs
+
     def pages_save_to_csv(self):
         """모든 페이지의 구직 정보를 CSV 파일로 저장"""
         try:
-            num_of_pages = self.get_pages()
-            all_jobs = []
-            
-            for i in range(num_of_pages):
-                url = self.jobs_page_url.format(i+1)
-                jobs = self.scrape_page(url)
-                all_jobs.extend(jobs)
-                logger.info(f"페이지 {i+1}/{num_of_pages} 스크래핑 완료: {len(jobs)}개 작업 가져옴")
+            all_jobs = self.crawl_all_pages()
                 
             if not all_jobs:
                 logger.warning("저장할 작업이 없습니다.")
@@ -190,18 +275,8 @@ class WWRJobSearch:
                 
             with open(f"wwr_jobs.csv", mode="w", encoding="utf-8") as file:
                 writer = csv.writer(file)
-                # 한 개의 작업을 인스턴스화하여 헤더 가져오기
-                if all_jobs:
-                    job_data = JobDataWWR(
-                        position=all_jobs[0][0],
-                        company=all_jobs[0][1],
-                        location=all_jobs[0][2],
-                        salary=all_jobs[0][3],
-                        link=all_jobs[0][4]
-                    )
-                    writer.writerow(job_data.get_headers())
-                    for job in all_jobs:
-                        writer.writerow(job)
+                writer.writerow(JobDataWWR.HEADERS)
+                writer.writerows(all_jobs)
                         
             logger.info(f"총 {len(all_jobs)}개 작업이 wwr_jobs.csv 파일에 저장되었습니다.")
         except Exception as e:
@@ -219,17 +294,8 @@ class WWRJobSearch:
                     
                 with open(f"wwr_{keyword}_jobs.csv", mode="w", encoding="utf-8") as file:
                     writer = csv.writer(file)
-                    # 한 개의 작업을 인스턴스화하여 헤더 가져오기
-                    job_data = JobDataWWR(
-                        position=keyword_jobs[0][0],
-                        company=keyword_jobs[0][1],
-                        location=keyword_jobs[0][2],
-                        salary=keyword_jobs[0][3],
-                        link=keyword_jobs[0][4]
-                    )
-                    writer.writerow(job_data.get_headers())
-                    for job in keyword_jobs:
-                        writer.writerow(job)
+                    writer.writerow(JobDataWWR.HEADERS)
+                    writer.writerows(keyword_jobs)
                         
                 logger.info(f"키워드 '{keyword}'에 대한 {len(keyword_jobs)}개 작업이 CSV 파일에 저장되었습니다.")
             except IOError as e:
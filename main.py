@@ -1,24 +1,79 @@
-from flask import Flask, redirect, render_template, request, send_file, url_for, make_response
+from flask import Flask, Response, jsonify, redirect, render_template, request, send_file, stream_with_context, url_for, make_response
 import logging
 from extractors.wwr import WWRJobSearch
 from extractors.wanted_job_search import WantedJobSearch
-from extractors.job_data import JobData
-from extractors.job_data_wwr import JobDataWWR
+from extractors.job_table import FOUND_ON_COLUMN, JobTable
+from extractors.dedup import dedupe
 import csv
 from datetime import datetime
 import io
+import json
+import os
+import threading
+import time
 from utils.logger import setup_logger
+from utils.fanout import FanOutExecutor
+from utils.circuit_breaker import guarded
+from utils.single_flight import coalesced
+from utils.search_jobs import SearchJobManager
+from utils.prewarm import CachePrewarmer
+from utils.browser_pool import shutdown_browser_pools
+from utils.parse_pool import shutdown_parse_pool
+import atexit
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
 
 # 로거 설정
 logger = setup_logger(__name__)
 
-app = Flask("JobScraper", static_folder='static', static_url_path='/static')
-
-# 검색 결과를 저장할 인메모리 데이터베이스
+# 검색 결과를 저장할 인메모리 데이터베이스 (키워드 -> 열 단위로 저장한 JobTable)
 db = {}
 
+# 키워드별 캐시 저장 시각 - SEARCH_CACHE_TTL(초)이 지나면 다시 스크래핑
+db_updated_at = {}
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", 3600))
+
+# 여러 출처/키워드에 중복으로 나온 공고를 하나로 합칠지 여부
+DEDUP_ENABLED = os.getenv("DEDUP_ENABLED", "true").lower() == "true"
+
+# 인기 키워드를 캐시 만료 전에 갱신 (크롤링은 일반 검색과 같은 소스 경로를 사용, 첫 검색 요청 시 시작)
+PREWARM_ENABLED = os.getenv("PREWARM_ENABLED", "true").lower() == "true"
+
+# 스레드 풀을 가진 애플리케이션 객체는 처음 사용할 때 생성
+# (파싱 프로세스 풀의 spawn 워커는 이 모듈을 __mp_main__으로 다시 임포트하므로 임포트 시점에는 만들지 않음)
+_search_executor = None
+_search_jobs = None
+_prewarmer = None
+_services_lock = threading.Lock()
+
+def get_search_executor():
+    """(키워드, 소스) 쌍을 동시에 스크래핑하는 실행기 반환 (없으면 생성)"""
+    global _search_executor
+    with _services_lock:
+        if _search_executor is None:
+            _search_executor = FanOutExecutor()
+        return _search_executor
+
+def get_search_jobs():
+    """/search 요청을 백그라운드에서 처리하는 검색 작업 관리자 반환 (없으면 생성)"""
+    global _search_jobs
+    with _services_lock:
+        if _search_jobs is None:
+            _search_jobs = SearchJobManager()
+        return _search_jobs
+
+def get_prewarmer():
+    """인기 키워드 캐시 예열기 반환 (없으면 생성)"""
+    global _prewarmer
+    with _services_lock:
+        if _prewarmer is None:
+            _prewarmer = CachePrewarmer(
+                refresh=lambda keyword: scrape_keywords([keyword]),
+                cache_age=cache_age,
+                cache_ttl=SEARCH_CACHE_TTL
+            )
+        return _prewarmer
+
 def create_csv_response(jobs, filename):
     """CSV 응답 생성 헬퍼 함수"""
     try:
@@ -26,17 +81,11 @@ def create_csv_response(jobs, filename):
         csv_buffer = io.StringIO()
         writer = csv.writer(csv_buffer)
         
-        # 헤더 결정
         if jobs:
-            if len(jobs[0]) == 5:  # WWR 데이터
-                headers = ["Position", "Company", "Location", "Salary", "Link"]
-            else:  # Wanted 데이터
-                headers = ["Position", "Company", "Reward", "Link"]
-            
-            # 헤더와 데이터 쓰기
+            # 레코드 클래스의 헤더 사용 (여러 출처가 섞여 있으면 Source 열을 포함한 통합 헤더)
+            headers, rows = jobs.export_rows()
             writer.writerow(headers)
-            for job in jobs:
-                writer.writerow(job)
+            writer.writerows(rows)
             
             # 응답 생성
             response = make_response(csv_buffer.getvalue())
@@ -58,12 +107,9 @@ def create_excel_response(jobs, filename):
         ws = wb.active
         ws.title = "Jobs"
         
-        # 헤더 결정
         if jobs:
-            if len(jobs[0]) == 5:  # WWR 데이터
-                headers = ["Position", "Company", "Location", "Salary", "Link"]
-            else:  # Wanted 데이터
-                headers = ["Position", "Company", "Reward", "Link"]
+            # 레코드 클래스의 헤더 사용 (여러 출처가 섞여 있으면 Source 열을 포함한 통합 헤더)
+            headers, rows = jobs.export_rows()
             
             # 헤더 스타일 설정
             header_font = Font(bold=True, color="FFFFFF")
@@ -78,7 +124,7 @@ def create_excel_response(jobs, filename):
                 cell.alignment = header_alignment
             
             # 데이터 작성
-            for row, job in enumerate(jobs, 2):
+            for row, job in enumerate(rows, 2):
                 for col, value in enumerate(job, 1):
                     cell = ws.cell(row=row, column=col, value=value)
                     cell.alignment = Alignment(horizontal="left", vertical="center")
@@ -114,59 +160,233 @@ def create_excel_response(jobs, filename):
         logger.error(f"Excel 생성 중 오류 발생: {str(e)}")
         raise
 
-@app.route("/")
 def home():
     """홈페이지 렌더링"""
     return render_template("home.html")
 
-@app.route("/search")
+def build_search_sources():
+    """검색에 사용할 (소스 이름, 스크래핑 함수) 목록 생성"""
+    # 결과 순서: WWR가 상단에 표시되도록 함
+    # 소스별 서킷 브레이커 - 차단된 소스는 건너뛰고 마지막 성공 결과를 사용
+    # 다른 요청이 같은 (소스, 키워드)를 스크래핑 중이면 그 결과를 기다려 공유
+    return [
+        ("WWR", coalesced("WWR", guarded("WWR", WWRJobSearch().scrape_keyword))),
+        ("Wanted", coalesced("Wanted", guarded("Wanted", WantedJobSearch(headless=False).scrape_keyword))),
+    ]
+
+def is_cached(keyword):
+    """키워드 결과가 캐시에 있고 아직 만료되지 않았는지 여부"""
+    return keyword in db and time.time() - db_updated_at.get(keyword, 0) < SEARCH_CACHE_TTL
+
+def cache_age(keyword):
+    """키워드 결과가 캐시된 지 지난 시간 (초, 캐시에 없으면 None)"""
+    if keyword not in db:
+        return None
+    return time.time() - db_updated_at.get(keyword, 0)
+
+def scrape_keywords(keywords, sources=None, progress=None):
+    """
+    키워드를 모든 소스에 동시에 요청하고 모든 소스가 성공한 키워드만 캐시에 저장
+    
+    캐시에는 출처 간 중복 공고를 합친 결과와 공고별 발견 출처를 저장합니다.
+    
+    Returns:
+        FanOutResult: 팬아웃 실행 결과
+    """
+    logger.info(f"키워드 {keywords}에 대한 새 검색 수행")
+    result = get_search_executor().run(keywords, sources or build_search_sources(), progress=progress)
+    for k in keywords:
+        jobs = result.jobs[k]
+        if k in result.failed:
+            logger.warning(f"키워드 '{k}' 일부 소스 실패 - 결과를 캐시하지 않음")
+        elif DEDUP_ENABLED:
+            db[k] = JobTable.from_records(*dedupe(jobs))
+            db_updated_at[k] = time.time()
+        else:
+            db[k] = JobTable.from_records(jobs)
+            db_updated_at[k] = time.time()
+        logger.info(f"키워드 '{k}': 총 {len(jobs)}개 작업을 찾았습니다")
+    return result
+
+def run_search(keywords, sources=None, progress=None):
+    """
+    캐시에 없는 키워드만 모든 소스에 동시에 요청하고 검색 결과 반환
+    
+    Args:
+        keywords (list): 검색 키워드 목록
+        sources (list, optional): (소스 이름, 스크래핑 함수) 목록 (기본값: build_search_sources())
+        progress (callable, optional): 팬아웃 실행기에 전달할 진행 상황 콜백
+        
+    Returns:
+        dict: jobs, found_on(공고별 발견 출처), jobs_count, duplicates_merged, time, timings,
+            stale_sources를 담은 결과 (JSON 직렬화 가능)
+    """
+    missing = [k for k in dict.fromkeys(keywords) if not is_cached(k)]
+    for k in keywords:
+        if k not in missing:
+            logger.info(f"캐시에서 키워드 '{k}'에 대한 결과 사용")
+    
+    timings = {}
+    stale_sources = []
+    fresh_jobs = {}
+    if missing:
+        result = scrape_keywords(missing, sources, progress)
+        timings = result.source_totals()
+        stale_sources = result.stale_sources()
+        fresh_jobs = result.jobs
+    
+    # 키워드별 결과를 이어 붙인 뒤 여러 키워드/출처에 중복으로 나온 공고를 합침
+    all_jobs = []
+    found_on = []
+    for k in keywords:
+        if k in fresh_jobs:
+            all_jobs.extend(fresh_jobs[k])
+            found_on.extend(job.source for job in fresh_jobs[k])
+        elif k in db:
+            all_jobs.extend(db[k])
+            found_on.extend(db[k].values(FOUND_ON_COLUMN))
+    
+    total = len(all_jobs)
+    if DEDUP_ENABLED:
+        all_jobs, found_on = dedupe(all_jobs, found_on)
+    
+    return {
+        "jobs": all_jobs,
+        "found_on": found_on,
+        "jobs_count": len(all_jobs),
+        "duplicates_merged": total - len(all_jobs),
+        "time": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "timings": timings,
+        "stale_sources": stale_sources,
+    }
+
 def search():
-    """검색 키워드에 따른 구직 정보 검색 및 결과 페이지 렌더링"""
+    """
+    검색 결과 페이지 렌더링
+    
+    모든 키워드가 캐시에 있으면 바로 결과를 보여주고, 그렇지 않으면 검색 작업을
+    백그라운드에 넣은 뒤 작업 ID만 담은 페이지를 반환합니다. 페이지는 기본적으로
+    Server-Sent Events로 소스별 결과를 받아 바로 표시하며, mode=poll이면 진행 상황을 주기적으로 조회합니다.
+    """
     keyword = request.args.get("keyword")
     if not keyword or keyword == "":
         logger.warning("빈 키워드로 검색 시도")
         return redirect("/")
         
-    keywords = keyword.split(",")
-    formatted_keywords = ", ".join([k.strip() for k in keywords])
-    all_jobs = []
+    keywords = [k.strip() for k in keyword.split(",") if k.strip()]
+    formatted_keywords = ", ".join(keywords)
+    
+    # 인기도 집계 - 자주 검색되는 키워드는 캐시 만료 전에 백그라운드에서 갱신
+    if PREWARM_ENABLED:
+        prewarmer = get_prewarmer()
+        prewarmer.start()
+        for k in dict.fromkeys(keywords):
+            prewarmer.popularity.record(k)
+    
+    missing = [k for k in dict.fromkeys(keywords) if not is_cached(k)]
+    if not missing:
+        return render_template("search.html", keyword=formatted_keywords, job_id=None, **run_search(keywords))
+    
+    sources = build_search_sources()
+    job = get_search_jobs().submit(
+        missing,
+        [name for name, _ in sources],
+        lambda job: run_search(keywords, sources, progress=job.update_progress)
+    )
     
-    for keyword in keywords:
-        keyword = keyword.strip()
-        if keyword in db:
-            logger.info(f"캐시에서 키워드 '{keyword}'에 대한 결과 사용")
-            jobs = db[keyword]
+    # 표시 순서대로 (키워드, 소스) 그룹 구성 - 캐시된 키워드는 결과를 바로 렌더링하고
+    # 나머지는 소스별 빈 그룹을 만들어 스트리밍 결과를 해당 위치에 추가
+    groups = []
+    for k in dict.fromkeys(keywords):
+        if k in missing:
+            groups.extend({"keyword": k, "source": name, "jobs": []} for name, _ in sources)
         else:
-            logger.info(f"키워드 '{keyword}'에 대한 새 검색 수행")
-            try:
-                logger.info(f"1. Wanted 사이트 스크래핑 시작: 키워드 '{keyword}'")
-                wanted = WantedJobSearch(headless=False).scrape_keyword(keyword)
-                logger.info(f"Wanted 검색 결과: {len(wanted)}개 작업 찾음")
-                
-                logger.info(f"2. WWR 사이트 스크래핑 시작: 키워드 '{keyword}'")
-                wwr = WWRJobSearch().scrape_keyword(keyword)
-                logger.info(f"WWR 검색 결과: {len(wwr)}개 작업 찾음")
-                
-                # 결과 순서 변경: WWR가 상단에 표시되도록 함
-                jobs = wwr + wanted
-                db[keyword] = jobs
-                logger.info(f"총 {len(jobs)}개 작업을 찾았습니다 (WWR: {len(wwr)}, Wanted: {len(wanted)})")
-            except Exception as e:
-                logger.error(f"스크래핑 중 오류 발생: {e}")
-                jobs = []
-        
-        all_jobs.extend(jobs)
+            groups.append({"keyword": k, "source": None, "jobs": db.get(k, [])})
     
-    search_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     return render_template(
         "search.html",
         keyword=formatted_keywords,
-        jobs=all_jobs,
-        jobs_count=len(all_jobs),
-        time=search_time
+        job_id=job.id,
+        stream=request.args.get("mode", "stream") != "poll",
+        groups=groups,
+        jobs=[],
+        found_on=[],
+        jobs_count=0,
+        duplicates_merged=0,
+        time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        timings={},
+        stale_sources=[]
     )
 
-@app.route("/export")
+def search_job_status(job_id):
+    """검색 작업의 소스별 진행 상황과 (완료 시) 최종 결과를 JSON으로 반환"""
+    job = get_search_jobs().get(job_id)
+    if job is None:
+        return jsonify({"error": "검색 작업을 찾을 수 없습니다"}), 404
+    return jsonify(job.to_dict())
+
+def search_job_events(job_id):
+    """
+    검색 작업 이벤트를 Server-Sent Events로 스트리밍
+    
+    progress(소스별 진행 단계), rows(소스별 작업 목록), summary(중복을 합친 최종 작업 목록과 발견 출처, jobs_count, 소요 시간) 또는
+    failed 이벤트를 발생 순서대로 보내고 summary/failed 이후 스트림을 종료합니다.
+    """
+    job = get_search_jobs().get(job_id)
+    if job is None:
+        return jsonify({"error": "검색 작업을 찾을 수 없습니다"}), 404
+    
+    def stream():
+        for item in job.iter_events():
+            if item is None:
+                # 프록시가 유휴 연결을 끊지 않도록 주석 줄 전송
+                yield ": keepalive\n\n"
+                continue
+            event, data = item
+            yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+    
+    return Response(
+        stream_with_context(stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def jobs_by_salary():
+    """
+    캐시된 검색 결과에서 연 환산 최대 급여가 min 이상인 공고를 JSON으로 반환
+
+    쿼리 파라미터: min(필수, 연 금액), currency(기본값 USD), keyword(쉼표로 구분, 없으면 캐시된 모든 키워드)
+    키워드마다 JobTable의 급여 정렬 인덱스를 이진 탐색하므로 캐시 전체를 훑지 않습니다.
+    """
+    try:
+        minimum = float(request.args.get("min", ""))
+    except ValueError:
+        return jsonify({"error": "min 파라미터에 숫자 금액이 필요합니다"}), 400
+    currency = request.args.get("currency", "USD").upper()
+    keyword = request.args.get("keyword")
+    keywords = [k.strip() for k in keyword.split(",") if k.strip()] if keyword else list(db)
+
+    all_jobs = []
+    found_on = []
+    for k in keywords:
+        table = db.get(k)
+        if table is None:
+            continue
+        matched = table.salary_at_least(minimum, currency)
+        all_jobs.extend(matched)
+        found_on.extend(matched.values(FOUND_ON_COLUMN))
+
+    if DEDUP_ENABLED:
+        all_jobs, found_on = dedupe(all_jobs, found_on)
+
+    return jsonify({
+        "jobs": all_jobs,
+        "found_on": found_on,
+        "jobs_count": len(all_jobs),
+        "min": minimum,
+        "currency": currency,
+    })
+
 def export():
     """저장된 검색 결과 페이지 렌더링 또는 파일 내보내기"""
     keyword = request.args.get("keyword")
@@ -206,5 +426,20 @@ def export():
         jobs=db.get(keyword, []) if keyword else []
     )
 
+def create_app():
+    """Flask 애플리케이션을 만들고 라우트와 종료 시 정리 작업 등록"""
+    app = Flask("JobScraper", static_folder='static', static_url_path='/static')
+    app.add_url_rule("/", view_func=home)
+    app.add_url_rule("/search", view_func=search)
+    app.add_url_rule("/search/jobs/<job_id>", view_func=search_job_status)
+    app.add_url_rule("/search/jobs/<job_id>/events", view_func=search_job_events)
+    app.add_url_rule("/jobs/salary", view_func=jobs_by_salary)
+    app.add_url_rule("/export", view_func=export)
+    
+    # 애플리케이션 종료 시 공유 브라우저 풀과 파싱 프로세스 풀 정리
+    atexit.register(shutdown_browser_pools)
+    atexit.register(shutdown_parse_pool)
+    return app
+
 if __name__ == "__main__":
-    app.run(host='0.0.0.0', port=8080, debug=True)
+    create_app().run(host='0.0.0.0', port=8080, debug=True)
@@ -0,0 +1,46 @@
+import logging
+from extractors.dedup import canonical_link, dedupe
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+from extractors.job_table import FOUND_ON_COLUMN, JobTable
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WWR_JOB = JobDataWWR("Senior Python Engineer", "Acme Inc.", "Anywhere in the World", "Not specified",
+                     "https://weworkremotely.com/remote-jobs/acme-senior-python-engineer")
+REMOTEOK_JOB = JobDataRemoteOK.create("Senior Python Engineer", "Acme", "🌏 Worldwide",
+                                      "https://remoteok.com/remote-jobs/senior-python-engineer-acme-1001")
+WANTED_JOB = JobData("백엔드 개발자", "원티드랩", "합격보상금 100만원", "https://www.wanted.co.kr/wd/251337")
+
+
+def test_canonical_link():
+    """스킴, www., 끝의 /, 추적용 쿼리, RemoteOK 슬러그 차이를 무시하는지 테스트"""
+    assert canonical_link("http://www.wanted.co.kr/wd/251337/?utm_source=x#top") == "wanted.co.kr/wd/251337"
+    assert canonical_link("https://remoteok.com/remote-jobs/senior-python-engineer-acme-1001") == \
+        canonical_link("https://remoteok.com/remote-jobs/1001")
+    assert canonical_link("https://example.com/jobs?b=2&a=1&ref=feed") == "example.com/jobs?a=1&b=2"
+
+
+def test_dedupe_merges_keywords_and_sources():
+    """키워드 간 같은 링크와 출처 간 비슷한 제목/회사를 합치고 출처를 유지하는지 테스트"""
+    same_source_other_posting = WWR_JOB._replace(link="https://weworkremotely.com/remote-jobs/acme-senior-python-engineer-eu")
+    wanted_again = WANTED_JOB._replace(link="https://wanted.co.kr/wd/251337/")
+    jobs = [WWR_JOB, WANTED_JOB, REMOTEOK_JOB, same_source_other_posting, wanted_again]
+
+    kept, found_on = dedupe(jobs)
+    assert kept == [WWR_JOB, WANTED_JOB, same_source_other_posting]
+    assert found_on == ["wwr, remoteok", "wanted", "wwr"]
+
+    # 캐시에 저장한 발견 출처가 다음 병합에도 이어지는지 확인
+    table = JobTable.from_records(kept, found_on)
+    kept, found_on = dedupe(list(table) + [REMOTEOK_JOB], table.values(FOUND_ON_COLUMN) + ["remoteok"])
+    assert len(kept) == 3 and found_on[0] == "wwr, remoteok"
+
+
+if __name__ == "__main__":
+    test_canonical_link()
+    test_dedupe_merges_keywords_and_sources()
+    logger.info("중복 공고 병합 테스트 통과")
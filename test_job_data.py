@@ -0,0 +1,38 @@
+import logging
+import pickle
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WANTED_JOB = JobData("Data Engineer", "토스", "합격보상금 70만원", "https://www.wanted.co.kr/wd/249812")
+WWR_JOB = JobDataWWR("Django Developer", "Beta", "Anywhere", "Not specified", "https://weworkremotely.com/remote-jobs/beta")
+
+
+def test_records_are_compact_rows():
+    """레코드가 __dict__ 없이 행 그대로 쓰이고 출처/헤더를 클래스에서 가져오는지 테스트"""
+    assert not hasattr(WANTED_JOB, "__dict__")
+    assert WANTED_JOB[0] == "Data Engineer" and WANTED_JOB[-1] == WANTED_JOB.link
+    assert (WANTED_JOB.source, WWR_JOB.source) == ("wanted", "wwr")
+    assert JobData.get_headers() == ["Position", "Company", "Reward", "Link"]
+    assert pickle.loads(pickle.dumps(WWR_JOB)) == WWR_JOB
+
+    ad = JobDataRemoteOK.create("Hire remote talent", "광고주", "정보 없음", "https://remoteok.com/hire", is_ad=True)
+    assert ad.salary == "Not specified" and ad.ad == "광고" and ad[-1] == ad.link
+
+
+def test_repeated_fields_are_interned():
+    """반복 필드는 공유 문자열을 쓰고 행마다 다른 제목은 그대로 두는지 테스트"""
+    first = JobDataWWR("A", "".join(["Be", "ta"]), "".join(["Any", "where"]), "Not specified", "https://a").interned()
+    second = JobDataWWR("B", "".join(["Be", "ta"]), "".join(["Any", "where"]), "Not specified", "https://b").interned()
+    assert first.company is second.company and first.location is second.location
+    assert first == ("A", "Beta", "Anywhere", "Not specified", "https://a")
+
+
+if __name__ == "__main__":
+    test_records_are_compact_rows()
+    test_repeated_fields_are_interned()
+    logger.info("구직 정보 레코드 테스트 통과")
@@ -0,0 +1,55 @@
+import logging
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+from extractors.job_table import JobTable
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+RECORDS = [
+    JobDataWWR("Django Developer", "Beta", "Anywhere in the World", "Not specified", "https://weworkremotely.com/remote-jobs/beta"),
+    JobData("백엔드 개발자", "원티드랩", "합격보상금 100만원", "https://www.wanted.co.kr/wd/251337"),
+    JobDataRemoteOK.create("Backend Engineer", "Acme", "Worldwide", "https://remoteok.com/remote-jobs/2",
+                           salary="💰 $90k", tags=["python", "aws"], posted_date="2024-05-02"),
+    JobDataRemoteOK.create("Senior Python Developer", "Acme", "Worldwide", "https://remoteok.com/remote-jobs/1",
+                           posted_date="2024-05-01"),
+]
+
+
+def test_table_round_trips_records():
+    """열 단위로 저장한 뒤 행 보기가 원래 레코드와 같은지 테스트"""
+    table = JobTable.from_records(RECORDS)
+
+    assert len(table) == 4
+    assert list(table) == RECORDS
+    assert [type(job) for job in table] == [type(job) for job in RECORDS]
+    assert table[-1] == RECORDS[-1]
+    assert list(table[1:3]) == RECORDS[1:3]
+
+
+def test_table_filter_sort_and_export():
+    """사전 인코딩 열 필터, epoch 정렬, 출처가 섞인 내보내기를 테스트"""
+    table = JobTable.from_records(RECORDS)
+
+    acme = table.filter(source="remoteok", company="Acme")
+    assert [job.title for job in acme.sort_by("posted_epoch")] == ["Senior Python Developer", "Backend Engineer"]
+    assert len(table.where("title", lambda title: "개발자" in title)) == 1
+    assert table.sort_by("company").values("company") == ["Acme", "Acme", "Beta", "원티드랩"]
+
+    headers, rows = table.export_rows()
+    assert headers == ["Source", "Position", "Company", "Location", "Salary", "Reward", "Posted Date", "Tags", "Ad", "Link"]
+    rows = list(rows)
+    assert [row[0] for row in rows] == ["wwr", "wanted", "remoteok", "remoteok"]
+    assert [row[1] for row in rows] == [job[0] for job in RECORDS]
+    assert rows[1] == ("wanted", "백엔드 개발자", "원티드랩", "", "", "합격보상금 100만원", "", "", "", RECORDS[1].link)
+
+    headers, rows = acme.export_rows()
+    assert headers == JobDataRemoteOK.get_headers() and list(rows) == [RECORDS[2], RECORDS[3]]
+
+
+if __name__ == "__main__":
+    test_table_round_trips_records()
+    test_table_filter_sort_and_export()
+    logger.info("JobTable 테스트 통과")
@@ -35,15 +35,7 @@ def test_remoteok_manual():
                 
                 # 헤더 작성
                 from extractors.job_data_remoteok import JobDataRemoteOK
-                job_data = JobDataRemoteOK(
-                    title=jobs[0][0], 
-                    company_name=jobs[0][1], 
-                    location=jobs[0][2], 
-                    link=jobs[0][3],
-                    salary=jobs[0][4],
-                    posted_date=jobs[0][5]
-                )
-                writer.writerow(job_data.get_headers())
+                writer.writerow(JobDataRemoteOK.HEADERS)
                 
                 # 데이터 작성
                 for job in jobs:
@@ -0,0 +1,87 @@
+import logging
+import os
+from extractors.remoteok import RemoteOKJobSearch
+from extractors.wanted_job_search import WantedJobSearch
+from extractors.wwr import parse_listing as parse_wwr_listing
+from utils.html_parser import FALLBACK_ENGINE, available_engines
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(source):
+    with open(os.path.join(FIXTURE_DIR, source, "search_python.html"), encoding="utf-8") as file:
+        return file.read()
+
+
+class WantedFromFixture(WantedJobSearch):
+    """브라우저 대신 저장된 검색 결과 페이지를 반환하는 Wanted 스크래퍼"""
+
+    def run_playwright(self, url, **kwargs):
+        return load_fixture("wanted")
+
+
+class RemoteOKFromFixture(RemoteOKJobSearch):
+    """브라우저 대신 저장된 검색 결과 페이지를 반환하는 RemoteOK 스크래퍼"""
+
+    def run_playwright(self, url, **kwargs):
+        return load_fixture("remoteok")
+
+
+def extract_all(engine, partial=True):
+    """지정한 파서 엔진(과 부분 파싱 여부)으로 세 소스의 픽스처에서 행 추출"""
+    settings = {"HTML_PARSER_ENGINE": engine, "HTML_PARTIAL_PARSE": "true" if partial else "false"}
+    previous = {name: os.environ.get(name) for name in settings}
+    os.environ.update(settings)
+    try:
+        return {
+            "wwr": parse_wwr_listing(load_fixture("wwr"))["jobs"],
+            "wanted": WantedFromFixture(headless=True, fetch_mode="browser").scrape_keyword_with_browser("python"),
+            "remoteok": RemoteOKFromFixture(fetch_mode="browser").scrape_keyword_with_browser("python"),
+        }
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_fallback_engine_rows():
+    """기본 html.parser 엔진이 픽스처에서 예상한 행을 추출하는지 테스트"""
+    rows = extract_all(FALLBACK_ENGINE)
+
+    assert [job[0] for job in rows["wwr"]] == ["Senior Python Engineer", "Django Developer", "Data Engineer (Python)"]
+    assert rows["wwr"][1][4] == "https://weworkremotely.com/remote-jobs/beta-django-developer"
+    assert [list(job) for job in rows["wanted"]] == [
+        ["백엔드 개발자 (Python/Django)", "원티드랩", "합격보상금 100만원", "https://www.wanted.co.kr/wd/251337"],
+        ["Data Engineer", "토스", "보상금 정보 없음", "https://www.wanted.co.kr/wd/249812"],
+        ["ML 엔지니어", "당근마켓", "합격보상금 70만원", "https://www.wanted.co.kr/wd/248001"],
+    ]
+    assert [job[0] for job in rows["remoteok"]] == ["Senior Python Developer", "Hire remote talent", "Backend Engineer"]
+    assert rows["remoteok"][0][3] == "💰 $70k - $120k"
+    assert rows["remoteok"][1][-2] == "광고" and rows["remoteok"][1][-1].startswith("https://")
+
+
+def test_engines_extract_identical_rows():
+    """설치된 모든 파서 엔진이 html.parser와 같은 행을 추출하는지 테스트"""
+    expected = extract_all(FALLBACK_ENGINE)
+    for engine in available_engines():
+        assert extract_all(engine) == expected, f"{engine} 엔진의 추출 결과가 다릅니다"
+    logger.info(f"비교한 엔진: {available_engines()}")
+
+
+def test_partial_parsing_extracts_identical_rows():
+    """채용 공고 영역만 파싱해도 전체 문서를 파싱한 것과 같은 행을 추출하는지 테스트"""
+    for engine in available_engines():
+        assert extract_all(engine, partial=True) == extract_all(engine, partial=False), f"{engine} 부분 파싱 결과가 다릅니다"
+
+
+if __name__ == "__main__":
+    test_fallback_engine_rows()
+    test_engines_extract_identical_rows()
+    test_partial_parsing_extracts_identical_rows()
+    logger.info("파서 엔진 일치 테스트 통과")
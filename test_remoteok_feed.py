@@ -0,0 +1,47 @@
+import logging
+from extractors.remoteok import RemoteOKJobSearch
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FEED_ENTRIES = [
+    {"position": "Senior Python Developer", "company": "Acme", "location": "Worldwide", "tags": ["python"],
+     "epoch": 1714521600, "salary_min": 70000, "salary_max": 120000, "url": "https://remoteok.com/remote-jobs/1"},
+    {"position": "Python Engineer", "company": "Beta", "tags": [], "epoch": 1e20, "id": 2},
+    {"position": "Python Engineer", "company": "Gamma", "tags": [], "epoch": "not a date", "id": 3},
+    {"position": "Django Developer", "company": "Delta", "tags": ["django"], "epoch": 1714521600, "id": 4},
+]
+
+
+class RemoteOKFromFeed(RemoteOKJobSearch):
+    """네트워크 대신 고정된 피드 항목을 사용하고 브라우저 대체 호출 여부만 기록하는 RemoteOK 스크래퍼"""
+
+    def __init__(self, entries):
+        super().__init__(fetch_mode="feed")
+        self.entries = entries
+        self.browser_calls = []
+
+    def _load_feed(self):
+        return self.entries
+
+    def scrape_keyword_with_browser(self, keyword, manual_captcha=False):
+        self.browser_calls.append(keyword)
+        return []
+
+
+def test_feed_entries_with_bad_epoch():
+    """게시일이 잘못된 피드 항목이 있어도 브라우저로 대체하지 않고 게시일만 비워 두는지 테스트"""
+    remoteok = RemoteOKFromFeed(FEED_ENTRIES)
+    jobs = remoteok.scrape_keyword("python")
+
+    assert remoteok.browser_calls == []
+    assert [job.company_name for job in jobs] == ["Acme", "Beta", "Gamma"]
+    assert jobs[0].salary == "💰 $70k - $120k" and jobs[0].posted_date
+    assert [job.posted_date for job in jobs[1:]] == ["", ""]
+    assert jobs[1].link == "https://remoteok.com/remote-jobs/2"
+
+
+if __name__ == "__main__":
+    test_feed_entries_with_bad_epoch()
+    logger.info("RemoteOK 피드 테스트 통과")
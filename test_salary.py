@@ -0,0 +1,67 @@
+import logging
+from extractors.job_data import JobData
+from extractors.job_data_remoteok import JobDataRemoteOK
+from extractors.job_data_wwr import JobDataWWR
+from extractors.job_table import JobTable
+from extractors.salary import Salary, parse_salary
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_parse_salary_formats():
+    """출처별 급여/보상금 문자열을 금액, 통화, 기간으로 정규화하는지 테스트"""
+    assert parse_salary("💰 $70k - $120k") == Salary(70000, 120000, "USD", "year")
+    assert parse_salary("💰 $40 - $60 /hr").annual_max() == 60 * 2080
+    assert parse_salary("€4,500 per month") == Salary(4500, 4500, "EUR", "month")
+    assert parse_salary("연봉 5000만원 ~ 1억 2000만원") == Salary(5e7, 1.2e8, "KRW", "year")
+
+    reward = parse_salary("합격보상금 100만원")
+    assert reward == Salary(1e6, 1e6, "KRW", "bonus") and reward.annual_max() is None
+    assert parse_salary("Not specified") is None and parse_salary("보상금 정보 없음") is None
+
+
+def test_parse_salary_separators_and_context():
+    """자릿수 구분 점, 해석할 수 없는 금액, 급여 문맥이 없는 숫자를 처리하는지 테스트"""
+    assert parse_salary("1.234.567원") == Salary(1234567, 1234567, "KRW", "year")
+    assert parse_salary("€50.000 - €60.000") == Salary(50000, 60000, "EUR", "year")
+    assert parse_salary("€1.234,56 per hour") == Salary(1234.56, 1234.56, "EUR", "hour")
+    assert parse_salary("💰 $1.5k") == Salary(1500, 1500, "USD", "year")
+
+    assert parse_salary("$1.2.3k") is None
+    assert parse_salary("$ .5k") is None
+    assert parse_salary("10-20 employees") is None
+
+    table = JobTable.from_records([
+        JobDataRemoteOK.create("Backend Engineer", "Acme", "Worldwide", "https://remoteok.com/remote-jobs/1",
+                               salary="$1.2.3k"),
+    ])
+    assert table.values("salary_currency") == [""]
+
+
+def test_table_salary_index():
+    """급여 숫자 열과 연봉 이상 조회가 이진 탐색 인덱스로 올바르게 동작하는지 테스트"""
+    records = [
+        JobDataRemoteOK.create("Backend Engineer", "Acme", "Worldwide", "https://remoteok.com/remote-jobs/1",
+                               salary="💰 $70k - $120k"),
+        JobDataWWR("Django Developer", "Beta", "Europe", "Not specified", "https://weworkremotely.com/remote-jobs/beta"),
+        JobDataRemoteOK.create("Contract Developer", "Gamma", "USA", "https://remoteok.com/remote-jobs/2",
+                               salary="💰 $40 - $50 /hr"),
+        JobData("백엔드 개발자", "원티드랩", "합격보상금 100만원", "https://www.wanted.co.kr/wd/251337"),
+    ]
+    table = JobTable.from_records(records)
+
+    assert table.values("salary_currency") == ["USD", "", "USD", "KRW"]
+    assert table.values("salary_period") == ["year", "", "hour", "bonus"]
+    assert [job.title for job in table.salary_at_least(100000)] == ["Backend Engineer", "Contract Developer"]
+    assert [job.title for job in table.salary_at_least(110000)] == ["Backend Engineer"]
+    assert len(table.salary_at_least(0, "KRW")) == 0
+    assert [job[0] for job in table[1:].salary_at_least(100000)] == ["Contract Developer"]
+
+
+if __name__ == "__main__":
+    test_parse_salary_formats()
+    test_parse_salary_separators_and_context()
+    test_table_salary_index()
+    logger.info("급여 정규화 테스트 통과")
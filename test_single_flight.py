@@ -0,0 +1,72 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.single_flight import SingleFlight, normalize_keyword
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def test_concurrent_callers_share_one_scrape():
+    """같은 키로 동시에 들어온 요청이 한 번만 실행되고 결과를 공유하는지 테스트"""
+    flight = SingleFlight(timeout=5)
+    calls = []
+    started = threading.Event()
+
+    def slow_scrape(keyword):
+        calls.append(keyword)
+        started.set()
+        time.sleep(0.3)
+        return [[keyword, "회사"]]
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        leader = executor.submit(flight.do, ("WWR", "python"), slow_scrape, "python")
+        started.wait()
+        followers = [executor.submit(flight.do, ("WWR", "python"), slow_scrape, "python") for _ in range(9)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert calls == ["python"]
+    assert all(result == [["python", "회사"]] for result in results)
+    assert flight.in_flight() == []
+
+
+def test_error_and_timeout_propagate():
+    """진행 중인 요청의 예외와 대기 시간 초과가 대기자에게 전달되는지 테스트"""
+    flight = SingleFlight(timeout=5)
+    started = threading.Event()
+
+    def failing_scrape(keyword):
+        started.set()
+        time.sleep(0.2)
+        raise RuntimeError("차단됨")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", failing_scrape, "python")
+        started.wait()
+        follower = executor.submit(flight.do, "key", failing_scrape, "python")
+        for future in (leader, follower):
+            try:
+                future.result()
+                assert False, "예외가 전달되지 않았습니다"
+            except RuntimeError as e:
+                assert str(e) == "차단됨"
+
+    impatient = SingleFlight(timeout=0.05)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(impatient.do, "key", lambda k: time.sleep(0.3) or [], "python")
+        time.sleep(0.05)
+        try:
+            impatient.do("key", lambda k: [], "python")
+            assert False, "대기 시간 초과가 발생하지 않았습니다"
+        except TimeoutError:
+            pass
+
+    assert normalize_keyword("  Python   Developer ") == "python developer"
+
+
+if __name__ == "__main__":
+    test_concurrent_callers_share_one_scrape()
+    test_error_and_timeout_propagate()
+    logger.info("single-flight 테스트 통과")
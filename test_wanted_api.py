@@ -0,0 +1,94 @@
+import json
+import logging
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from extractors.wanted_job_search import WantedJobSearch
+
+# 로깅 설정
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures", "wanted")
+
+
+class WantedStubHandler(BaseHTTPRequestHandler):
+    """녹화된 JSON 픽스처를 offset별로 응답하는 Wanted 검색 API 스텁"""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        keyword = query.get("query", [""])[0]
+        offset = query.get("offset", ["0"])[0]
+        path = os.path.join(FIXTURE_DIR, f"search_{keyword}_offset{offset}.json")
+        if not os.path.exists(path):
+            body = b'{"message": "not found"}'
+            self.send_response(404)
+        else:
+            with open(path, "rb") as file:
+                body = file.read()
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    """로컬 스텁 서버를 백그라운드 스레드에서 실행"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WantedStubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class WantedJobSearchWithoutBrowser(WantedJobSearch):
+    """브라우저 대체 경로 호출 여부만 기록하는 테스트용 스크래퍼"""
+
+    def __init__(self, api_url):
+        super().__init__(headless=True, fetch_mode="api")
+        self.api_url = api_url
+        self.browser_calls = []
+
+    def scrape_keyword_with_browser(self, keyword):
+        self.browser_calls.append(keyword)
+        return [["브라우저", "대체", "보상금 정보 없음", "https://www.wanted.co.kr/wd/0"]]
+
+
+def test_wanted_api_pagination():
+    """JSON API의 여러 페이지를 따라가며 JobData 행을 만드는지 테스트"""
+    server = start_stub_server()
+    try:
+        wanted = WantedJobSearchWithoutBrowser(f"http://127.0.0.1:{server.server_port}/api/v4/jobs")
+        jobs = wanted.scrape_keyword("python")
+    finally:
+        server.shutdown()
+
+    assert wanted.browser_calls == []
+    assert [list(job) for job in jobs] == [
+        ["백엔드 개발자 (Python/Django)", "원티드랩", "합격보상금 100만원", "https://www.wanted.co.kr/wd/251337"],
+        ["Data Engineer", "토스", "합격보상금 70만원", "https://www.wanted.co.kr/wd/249812"],
+        ["ML 엔지니어", "당근마켓", "보상금 정보 없음", "https://www.wanted.co.kr/wd/248001"],
+    ]
+
+
+def test_wanted_api_falls_back_to_browser():
+    """API 요청이 실패하면 브라우저 경로로 대체하는지 테스트"""
+    server = start_stub_server()
+    try:
+        wanted = WantedJobSearchWithoutBrowser(f"http://127.0.0.1:{server.server_port}/api/v4/jobs")
+        jobs = wanted.scrape_keyword("unknown")
+    finally:
+        server.shutdown()
+
+    assert wanted.browser_calls == ["unknown"]
+    assert jobs[0][0] == "브라우저"
+
+
+if __name__ == "__main__":
+    test_wanted_api_pagination()
+    test_wanted_api_falls_back_to_browser()
+    logger.info("Wanted API 테스트 통과")
@@ -0,0 +1,245 @@
+"""
+여러 스크래핑 요청이 공유하는 Playwright 브라우저/컨텍스트 풀
+
+Playwright sync API 객체는 생성한 스레드에서만 사용할 수 있으므로,
+각 브라우저는 전용 스레드(슬롯)가 소유하고 작업은 해당 스레드에서 실행됩니다.
+"""
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from playwright.sync_api import sync_playwright
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정 (환경 변수로 변경 가능)
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES_PER_CONTEXT = 20
+DEFAULT_ACQUIRE_TIMEOUT = 120
+
+# 생성된 풀 목록 (이름, 실행 옵션) -> BrowserPool
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def _freeze(value):
+    """딕셔너리/리스트를 해시 가능한 형태로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class _BrowserSlot:
+    """브라우저 하나와 그 브라우저의 웜 컨텍스트를 소유하는 전용 스레드"""
+
+    def __init__(self, name, launch_options, max_pages_per_context):
+        self.name = name
+        self.launch_options = launch_options
+        self.max_pages_per_context = max_pages_per_context
+        self._playwright = None
+        self._browser = None
+        self._contexts = {}  # 컨텍스트 키 -> [context, 사용한 페이지 수]
+        self._tasks = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    def _loop(self):
+        """작업 큐에서 작업을 꺼내 이 스레드에서 실행"""
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                self._close_browser()
+                break
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(self, func, *args):
+        """슬롯 스레드에서 func(*args)를 실행하고 Future 반환"""
+        future = Future()
+        self._tasks.put((future, func, args))
+        return future
+
+    def _is_healthy(self):
+        """브라우저가 살아 있는지 확인"""
+        try:
+            return self._browser is not None and self._browser.is_connected()
+        except Exception:
+            return False
+
+    def _ensure_browser(self):
+        """브라우저가 없거나 연결이 끊긴 경우 새로 실행"""
+        if self._is_healthy():
+            return self._browser
+        if self._browser is not None:
+            logger.warning(f"[{self.name}] 브라우저 연결 끊김 감지 - 재시작합니다")
+        self._close_browser()
+        self._playwright = sync_playwright().start()
+        self._browser = self._playwright.chromium.launch(**self.launch_options)
+        logger.info(f"[{self.name}] 브라우저 실행 완료")
+        return self._browser
+
+    def _close_context(self, key):
+        """컨텍스트 닫기"""
+        entry = self._contexts.pop(key, None)
+        if entry:
+            try:
+                entry[0].close()
+            except Exception as e:
+                logger.info(f"[{self.name}] 컨텍스트 종료 중 오류 (무시): {e}")
+
+    def _close_browser(self):
+        """모든 컨텍스트, 브라우저, Playwright 종료"""
+        for key in list(self._contexts):
+            self._close_context(key)
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.info(f"[{self.name}] 브라우저 종료 중 오류 (무시): {e}")
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.info(f"[{self.name}] Playwright 종료 중 오류 (무시): {e}")
+            self._playwright = None
+
+    def _get_context(self, context_options, init_script, fresh_context):
+        """컨텍스트 키에 해당하는 웜 컨텍스트 반환 (필요시 재생성)"""
+        key = (_freeze(context_options), init_script)
+        entry = self._contexts.get(key)
+        if entry and (fresh_context or entry[1] >= self.max_pages_per_context):
+            self._close_context(key)
+            entry = None
+        if entry is None:
+            context = self._browser.new_context(**context_options)
+            if init_script:
+                context.add_init_script(init_script)
+            entry = [context, 0]
+            self._contexts[key] = entry
+        return key, entry
+
+    def run_task(self, task, context_options, init_script, fresh_context):
+        """웜 컨텍스트에서 새 페이지를 열어 task(page) 실행 (슬롯 스레드 전용)"""
+        self._ensure_browser()
+        key, entry = self._get_context(context_options, init_script, fresh_context)
+        page = entry[0].new_page()
+        try:
+            return task(page)
+        except Exception:
+            # 작업 실패 시 컨텍스트 상태를 신뢰할 수 없으므로 폐기
+            self._close_context(key)
+            raise
+        finally:
+            try:
+                if not page.is_closed():
+                    page.close()
+            except Exception:
+                pass
+            entry[1] += 1
+            if key in self._contexts and entry[1] >= self.max_pages_per_context:
+                logger.info(f"[{self.name}] 컨텍스트 페이지 한도({self.max_pages_per_context}) 도달 - 재활용")
+                self._close_context(key)
+
+    def shutdown(self, timeout=10):
+        """슬롯 스레드 종료 요청 후 대기"""
+        self._tasks.put(None)
+        self._thread.join(timeout)
+
+
+class BrowserPool:
+    """
+    크기가 제한된 Playwright 브라우저 풀
+
+    각 슬롯은 하나의 브라우저를 계속 유지하며, 컨텍스트 옵션별 웜 컨텍스트를
+    max_pages_per_context 페이지마다 재활용합니다.
+    """
+
+    def __init__(self, name, launch_options=None, size=None, max_pages_per_context=None,
+                 acquire_timeout=None):
+        if size is None:
+            size = int(os.getenv("BROWSER_POOL_SIZE", DEFAULT_POOL_SIZE))
+        if max_pages_per_context is None:
+            max_pages_per_context = int(os.getenv("BROWSER_MAX_PAGES_PER_CONTEXT", DEFAULT_MAX_PAGES_PER_CONTEXT))
+        if acquire_timeout is None:
+            acquire_timeout = float(os.getenv("BROWSER_ACQUIRE_TIMEOUT", DEFAULT_ACQUIRE_TIMEOUT))
+        self.name = name
+        self.size = max(1, size)
+        self.acquire_timeout = acquire_timeout
+        self._closed = False
+        self._slots = [
+            _BrowserSlot(f"browser-{name}-{i}", launch_options or {}, max(1, max_pages_per_context))
+            for i in range(self.size)
+        ]
+        self._idle = queue.Queue()
+        for slot in self._slots:
+            self._idle.put(slot)
+        logger.info(f"BrowserPool '{name}' 생성: 크기 = {self.size}, 컨텍스트당 최대 페이지 = {max_pages_per_context}")
+
+    def run(self, task, context_options=None, init_script=None, fresh_context=False):
+        """
+        풀에서 페이지를 빌려 task(page)를 실행하고 그 결과 반환
+
+        Args:
+            task (callable): Playwright Page를 받아 결과를 반환하는 함수 (슬롯 스레드에서 실행됨)
+            context_options (dict, optional): browser.new_context()에 전달할 옵션
+            init_script (str, optional): 컨텍스트 생성 시 추가할 초기화 스크립트
+            fresh_context (bool): True이면 기존 웜 컨텍스트를 버리고 새로 생성
+
+        Raises:
+            TimeoutError: acquire_timeout 내에 사용 가능한 브라우저가 없는 경우
+            RuntimeError: 풀이 이미 종료된 경우
+        """
+        if self._closed:
+            raise RuntimeError(f"BrowserPool '{self.name}'이(가) 이미 종료되었습니다")
+        try:
+            slot = self._idle.get(timeout=self.acquire_timeout)
+        except queue.Empty:
+            raise TimeoutError(f"BrowserPool '{self.name}'에서 {self.acquire_timeout}초 내에 브라우저를 얻지 못했습니다")
+        try:
+            future = slot.submit(slot.run_task, task, context_options or {}, init_script, fresh_context)
+            return future.result()
+        finally:
+            self._idle.put(slot)
+
+    def health_check(self):
+        """슬롯별 브라우저 상태 반환 (True = 연결됨, False = 미실행 또는 끊김)"""
+        return [slot.submit(slot._is_healthy).result() for slot in self._slots]
+
+    def shutdown(self):
+        """모든 브라우저 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        for slot in self._slots:
+            slot.shutdown()
+        logger.info(f"BrowserPool '{self.name}' 종료 완료")
+
+
+def get_browser_pool(name, **launch_options):
+    """이름과 실행 옵션별로 공유되는 BrowserPool 반환 (없으면 생성)"""
+    key = (name, _freeze(launch_options))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = BrowserPool(name, launch_options)
+            _pools[key] = pool
+        return pool
+
+
+def shutdown_browser_pools():
+    """생성된 모든 BrowserPool 종료 (애플리케이션 종료 시 호출)"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown()
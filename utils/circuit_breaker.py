@@ -0,0 +1,166 @@
+"""
+소스별 서킷 브레이커
+
+최근 호출의 실패율과 캡차 비율이 높아지면 회로를 열어(open) 해당 소스를 즉시 건너뛰고,
+마지막으로 성공한 결과를 오래된(stale) 결과로 제공합니다. 일정 시간이 지나면
+반개방(half-open) 상태에서 단 한 번의 탐색 요청으로 복구 여부를 확인합니다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 기본 설정
+DEFAULT_WINDOW_SIZE = 10          # 최근 몇 번의 호출 결과를 볼지
+DEFAULT_WINDOW_SECONDS = 300      # 이보다 오래된 결과는 무시
+DEFAULT_MIN_CALLS = 4             # 실패율을 판단하기 위한 최소 호출 수
+DEFAULT_FAILURE_RATE = 0.5        # 이 비율 이상 실패하면 회로 열림
+DEFAULT_CAPTCHA_THRESHOLD = 2     # 창 안에서 캡차가 이 횟수 이상이면 회로 열림
+DEFAULT_OPEN_SECONDS = 120        # 회로가 열린 뒤 탐색 요청까지 대기 시간
+DEFAULT_STALE_KEYWORDS = 500      # 소스별로 보관할 마지막 성공 결과의 최대 키워드 수
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 소스 호출을 건너뛴 경우"""
+
+    def __init__(self, name, stale_jobs=None):
+        super().__init__(f"'{name}' 소스의 회로가 열려 있습니다")
+        self.name = name
+        self.stale_jobs = stale_jobs
+
+
+class CircuitBreaker:
+    """closed -> open -> half-open 상태를 가지는 스레드 안전 서킷 브레이커"""
+
+    def __init__(self, name, window_size=DEFAULT_WINDOW_SIZE, window_seconds=DEFAULT_WINDOW_SECONDS,
+                 min_calls=DEFAULT_MIN_CALLS, failure_rate=DEFAULT_FAILURE_RATE,
+                 captcha_threshold=DEFAULT_CAPTCHA_THRESHOLD, open_seconds=None):
+        if open_seconds is None:
+            open_seconds = float(os.getenv("CIRCUIT_OPEN_SECONDS", DEFAULT_OPEN_SECONDS))
+        self.name = name
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.captcha_threshold = captcha_threshold
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window_size)  # (시각, "ok" | "fail" | "captcha")
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._last_good = OrderedDict()  # 키워드 -> 마지막 성공 결과
+        self._lock = threading.Lock()
+
+    def _prune(self, now):
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+
+    def _open(self, now, reason):
+        self.state = OPEN
+        self._opened_at = now
+        self._probe_in_flight = False
+        logger.warning(f"[{self.name}] 회로 열림: {reason} - {self.open_seconds:.0f}초 동안 건너뜀")
+
+    def allow_request(self):
+        """
+        호출 허용 여부 반환
+
+        open 상태에서 대기 시간이 지나면 half-open으로 바꾸고 한 번의 탐색 요청만 허용합니다.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+                logger.info(f"[{self.name}] 회로 반개방 - 탐색 요청 허용")
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        """호출 성공 기록"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                logger.info(f"[{self.name}] 탐색 요청 성공 - 회로 닫힘")
+                self.state = CLOSED
+                self._outcomes.clear()
+                self._probe_in_flight = False
+            self._outcomes.append((time.monotonic(), "ok"))
+
+    def record_failure(self, captcha=False):
+        """호출 실패 기록 (captcha=True이면 캡차/봇 차단으로 인한 실패)"""
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._open(now, "탐색 요청 실패")
+                return
+            self._outcomes.append((now, "captcha" if captcha else "fail"))
+            if self.state != CLOSED:
+                return
+            self._prune(now)
+            total = len(self._outcomes)
+            failures = sum(1 for _, outcome in self._outcomes if outcome != "ok")
+            captchas = sum(1 for _, outcome in self._outcomes if outcome == "captcha")
+            if captchas >= self.captcha_threshold:
+                self._open(now, f"최근 {total}회 중 캡차 {captchas}회")
+            elif total >= self.min_calls and failures / total >= self.failure_rate:
+                self._open(now, f"최근 {total}회 중 실패 {failures}회")
+
+    def last_good(self, keyword):
+        """키워드에 대한 마지막 성공 결과 반환 (없으면 None)"""
+        with self._lock:
+            return self._last_good.get(keyword)
+
+    def call(self, func, keyword):
+        """
+        회로 상태를 확인한 뒤 func(keyword) 실행
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있는 경우 (마지막 성공 결과를 stale_jobs로 전달)
+        """
+        if not self.allow_request():
+            raise CircuitOpenError(self.name, self.last_good(keyword))
+        try:
+            jobs = func(keyword)
+        except Exception as e:
+            self.record_failure(captcha=getattr(e, "captcha", False))
+            raise
+        self.record_success()
+        with self._lock:
+            self._last_good[keyword] = jobs
+            self._last_good.move_to_end(keyword)
+            while len(self._last_good) > DEFAULT_STALE_KEYWORDS:
+                self._last_good.popitem(last=False)
+        return jobs
+
+
+# 소스 이름 -> CircuitBreaker
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(name):
+    """소스 이름별로 공유되는 CircuitBreaker 반환 (없으면 생성)"""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name)
+            _breakers[name] = breaker
+        return breaker
+
+
+def guarded(name, func):
+    """func(keyword)를 소스별 서킷 브레이커로 감싼 함수 반환"""
+    def call(keyword):
+        return get_circuit_breaker(name).call(func, keyword)
+    return call
@@ -0,0 +1,134 @@
+"""
+(키워드, 소스) 쌍을 동시에 스크래핑하기 위한 팬아웃 실행기
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.circuit_breaker import CircuitOpenError
+from utils.logger import setup_logger
+from utils.progress import DONE, FAILED, FETCHING, STALE, tracking
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 동시 실행 수 (SEARCH_MAX_WORKERS 환경 변수로 변경 가능)
+DEFAULT_MAX_WORKERS = 4
+
+
+class FanOutResult:
+    """팬아웃 실행 결과 (키워드별 작업 목록, 소스별 소요 시간, 실패한 키워드, 오래된 결과)"""
+
+    def __init__(self):
+        self.jobs = {}       # keyword -> 병합된 작업 목록
+        self.timings = {}    # keyword -> {source: 소요 시간(초)}
+        self.failed = set()  # 하나 이상의 소스가 실패한 키워드
+        self.stale = {}      # keyword -> 회로가 열려 마지막 성공 결과로 대체된 소스 목록
+
+    def stale_sources(self):
+        """오래된 결과로 대체된 소스 이름 목록 반환"""
+        return sorted({source for sources in self.stale.values() for source in sources})
+
+    def source_totals(self):
+        """소스별 누적 소요 시간 반환"""
+        totals = {}
+        for per_source in self.timings.values():
+            for source, elapsed in per_source.items():
+                totals[source] = totals.get(source, 0.0) + elapsed
+        return totals
+
+
+class FanOutExecutor:
+    """
+    모든 (키워드, 소스) 쌍을 스레드 풀에서 동시에 실행하는 클래스
+
+    소스는 (이름, 스크래핑 함수) 튜플의 리스트로 전달되며,
+    결과는 키워드마다 소스 목록의 순서대로 병합됩니다.
+    """
+
+    def __init__(self, max_workers=None):
+        if max_workers is None:
+            max_workers = int(os.getenv("SEARCH_MAX_WORKERS", DEFAULT_MAX_WORKERS))
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="search-fanout"
+        )
+        logger.info(f"FanOutExecutor 초기화: 최대 동시 실행 수 = {self.max_workers}")
+
+    def _timed_call(self, source_name, func, keyword, progress):
+        """스크래핑 함수를 실행하고 (결과, 소요 시간) 반환"""
+        def report(phase, jobs=None):
+            if progress is not None:
+                progress(keyword, source_name, phase, jobs)
+        
+        started = time.perf_counter()
+        report(FETCHING)
+        try:
+            with tracking(report):
+                jobs = func(keyword)
+        except CircuitOpenError as e:
+            report(STALE, e.stale_jobs or [])
+            raise
+        except Exception as e:
+            elapsed = time.perf_counter() - started
+            logger.error(f"{source_name} 스크래핑 중 오류 발생 (키워드 '{keyword}'): {e}")
+            report(FAILED)
+            raise _SourceError(elapsed) from e
+        report(DONE, jobs)
+        return jobs, time.perf_counter() - started
+
+    def run(self, keywords, sources, progress=None):
+        """
+        키워드와 소스의 모든 조합을 동시에 스크래핑
+
+        Args:
+            keywords (list): 검색 키워드 목록
+            sources (list): (소스 이름, keyword -> 작업 목록 함수) 튜플 목록
+            progress (callable, optional): progress(keyword, source, phase, jobs) 형태의 진행 상황 콜백
+                (phase는 utils.progress의 단계 상수, jobs는 완료 시 해당 소스의 작업 목록)
+
+        Returns:
+            FanOutResult: 키워드별 병합 결과와 소스별 소요 시간
+        """
+        result = FanOutResult()
+        futures = {}
+        for keyword in dict.fromkeys(keywords):
+            for source_name, func in sources:
+                futures[(keyword, source_name)] = self._executor.submit(
+                    self._timed_call, source_name, func, keyword, progress
+                )
+
+        for keyword in dict.fromkeys(keywords):
+            merged = []
+            timings = {}
+            for source_name, _ in sources:
+                try:
+                    jobs, elapsed = futures[(keyword, source_name)].result()
+                except _SourceError as e:
+                    jobs, elapsed = [], e.elapsed
+                    result.failed.add(keyword)
+                except CircuitOpenError as e:
+                    # 회로가 열린 소스는 건너뛰고 마지막 성공 결과를 오래된 결과로 사용
+                    jobs, elapsed = e.stale_jobs or [], 0.0
+                    result.failed.add(keyword)
+                    result.stale.setdefault(keyword, []).append(source_name)
+                    logger.warning(f"{source_name} 회로 열림 - 키워드 '{keyword}'에 마지막 성공 결과 {len(jobs)}개 사용")
+                timings[source_name] = elapsed
+                logger.info(f"{source_name} 검색 결과: 키워드 '{keyword}', {len(jobs)}개 작업 ({elapsed:.2f}초)")
+                merged.extend(jobs)
+            result.jobs[keyword] = merged
+            result.timings[keyword] = timings
+
+        return result
+
+    def shutdown(self, wait=True):
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=wait)
+
+
+class _SourceError(Exception):
+    """소스 실행 실패 시 소요 시간을 함께 전달하기 위한 내부 예외"""
+
+    def __init__(self, elapsed):
+        super().__init__()
+        self.elapsed = elapsed
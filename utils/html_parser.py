@@ -0,0 +1,76 @@
+"""
+HTML 파서 엔진 선택
+
+모든 추출기는 BeautifulSoup 노드 API(find, find_all, get, text 등)를 그대로 사용하고,
+트리를 만드는 백엔드만 설치된 엔진 중 가장 빠른 것으로 바꿉니다.
+lxml이 설치되어 있으면 lxml을, 없으면 순수 파이썬 html.parser를 사용합니다.
+
+추출기가 SoupStrainer를 넘기면 채용 공고 영역만 트리로 만들고 헤더, 푸터, 스크립트, SVG 등
+나머지 요소는 노드를 만들지 않고 건너뜁니다 (부분 파싱).
+"""
+import importlib.util
+import os
+from bs4 import BeautifulSoup
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 엔진 이름 -> 필요한 모듈 (빠른 순서, html.parser는 표준 라이브러리라 항상 사용 가능)
+ENGINES = {
+    "lxml": "lxml",
+    "html.parser": None,
+}
+FALLBACK_ENGINE = "html.parser"
+
+_warned = set()
+
+
+def available_engines():
+    """현재 환경에서 사용 가능한 엔진 이름 목록 (빠른 순서)"""
+    return [name for name, module in ENGINES.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def get_engine(name=None):
+    """
+    사용할 엔진 이름 반환
+
+    Args:
+        name (str, optional): "auto", "lxml", "html.parser" 중 하나 (기본값: HTML_PARSER_ENGINE 환경 변수 또는 auto)
+
+    설치되지 않은 엔진을 지정하면 경고 후 html.parser로 대체합니다.
+    """
+    name = (name or os.getenv("HTML_PARSER_ENGINE", "auto")).lower()
+    engines = available_engines()
+    if name == "auto":
+        return engines[0]
+    if name in engines:
+        return name
+    if name not in _warned:
+        _warned.add(name)
+        logger.warning(f"HTML 파서 엔진 '{name}'을(를) 사용할 수 없어 {FALLBACK_ENGINE}(으)로 대체합니다")
+    return FALLBACK_ENGINE
+
+
+def is_partial_parsing_enabled():
+    """부분 파싱 사용 여부 (HTML_PARTIAL_PARSE 환경 변수, 기본값 true)"""
+    return os.getenv("HTML_PARTIAL_PARSE", "true").lower() == "true"
+
+
+def parse_html(content, engine=None, parse_only=None):
+    """
+    HTML 문자열/바이트를 BeautifulSoup 트리로 파싱
+
+    Args:
+        content (str | bytes): HTML 콘텐츠
+        engine (str, optional): 사용할 엔진 (기본값: get_engine())
+        parse_only (SoupStrainer, optional): 트리로 만들 최상위 요소 필터
+            (부분 파싱이 꺼져 있으면 무시하고 전체 문서를 파싱)
+
+    Returns:
+        BeautifulSoup: 파싱된 문서 (parse_only를 쓴 경우 일치한 요소와 그 하위 요소만 포함)
+    """
+    if parse_only is not None and is_partial_parsing_enabled():
+        return BeautifulSoup(content, get_engine(engine), parse_only=parse_only)
+    return BeautifulSoup(content, get_engine(engine))
@@ -0,0 +1,217 @@
+"""
+ETag / Last-Modified 검증자를 사용하는 디스크 기반 조건부 GET 캐시
+
+응답 본문과 함께 본문에서 추출한 데이터(예: 작업 목록)를 저장하여,
+서버가 304 Not Modified를 반환하면 다시 파싱하지 않고 저장된 데이터를 재사용합니다.
+크기 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (LRU).
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(".cache", "http")
+DEFAULT_MAX_MB = 50
+DEFAULT_MAX_BYTES = DEFAULT_MAX_MB * 1024 * 1024
+
+
+class CacheEntry:
+    """캐시 항목 (검증자, 본문, 추출 데이터)"""
+
+    def __init__(self, url, etag=None, last_modified=None, data=None, body_path=None):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.data = data
+        self.body_path = body_path
+
+    def validator_headers(self):
+        """재검증 요청에 사용할 조건부 헤더 반환"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def read_body(self):
+        """저장된 응답 본문 반환 (없으면 None)"""
+        try:
+            with open(self.body_path, "rb") as file:
+                return file.read()
+        except (OSError, TypeError):
+            return None
+
+
+class HttpCache:
+    """
+    URL별 응답을 디스크에 저장하는 LRU 캐시 (스레드 안전)
+
+    각 항목은 <키>.json(메타데이터와 추출 데이터)과 <키>.body(응답 본문) 두 파일로 저장됩니다.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # 키 -> [마지막 사용 시각, 크기]
+        os.makedirs(directory, exist_ok=True)
+
+    def _key(self, url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load_index(self):
+        """디스크의 캐시 항목으로 LRU 인덱스 구성 (최초 1회)"""
+        if self._index is not None:
+            return
+        self._index = {}
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-5]
+            meta_path, body_path = self._paths(key)
+            try:
+                size = os.path.getsize(meta_path)
+                if os.path.exists(body_path):
+                    size += os.path.getsize(body_path)
+                self._index[key] = [os.path.getmtime(meta_path), size]
+            except OSError:
+                continue
+
+    def _write_atomic(self, path, payload):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, url):
+        """URL에 해당하는 캐시 항목 반환 (없으면 None)"""
+        key = self._key(url)
+        meta_path, body_path = self._paths(key)
+        with self._lock:
+            self._load_index()
+            if key not in self._index:
+                return None
+            try:
+                with open(meta_path, "r", encoding="utf-8") as file:
+                    meta = json.load(file)
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+        return CacheEntry(url, meta.get("etag"), meta.get("last_modified"), meta.get("data"), body_path)
+
+    def touch(self, url):
+        """항목을 최근 사용으로 표시 (LRU 갱신)"""
+        key = self._key(url)
+        with self._lock:
+            self._load_index()
+            if key in self._index:
+                now = time.time()
+                self._index[key][0] = now
+                try:
+                    os.utime(self._paths(key)[0], (now, now))
+                except OSError:
+                    pass
+
+    def put(self, url, response, data=None):
+        """
+        응답과 추출 데이터를 캐시에 저장
+
+        검증자(ETag, Last-Modified)가 없는 응답은 재검증할 수 없으므로 저장하지 않습니다.
+
+        Args:
+            url (str): 요청 URL
+            response: requests.Response 객체
+            data: 본문에서 추출한 JSON 직렬화 가능한 데이터
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        key = self._key(url)
+        meta_path, body_path = self._paths(key)
+        meta = json.dumps({
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "data": data,
+        }, ensure_ascii=False).encode("utf-8")
+        body = response.content
+        with self._lock:
+            self._load_index()
+            try:
+                self._write_atomic(body_path, body)
+                self._write_atomic(meta_path, meta)
+            except OSError as e:
+                logger.error(f"캐시 저장 중 오류 발생 ({url}): {e}")
+                self._remove(key)
+                return
+            self._index[key] = [time.time(), len(meta) + len(body)]
+            self._evict()
+
+    def _remove(self, key):
+        """항목 삭제 (잠금을 잡은 상태에서 호출)"""
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        if self._index is not None:
+            self._index.pop(key, None)
+
+    def _evict(self):
+        """전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제 (잠금을 잡은 상태에서 호출)"""
+        total = sum(size for _, size in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for key, (_, size) in sorted(self._index.items(), key=lambda item: item[1][0]):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+            logger.info(f"캐시 항목 삭제 (LRU): {key}")
+
+    def total_bytes(self):
+        """현재 캐시 전체 크기 (바이트)"""
+        with self._lock:
+            self._load_index()
+            return sum(size for _, size in self._index.values())
+
+
+# 이름 -> HttpCache
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(name):
+    """
+    이름별로 공유되는 HttpCache 반환
+
+    HTTP_CACHE_ENABLED=false이면 None을 반환하며, 저장 위치와 크기 상한은
+    HTTP_CACHE_DIR, HTTP_CACHE_MAX_MB 환경 변수로 변경할 수 있습니다.
+    """
+    if os.getenv("HTTP_CACHE_ENABLED", "true").lower() in ("false", "0", "no"):
+        return None
+    with _caches_lock:
+        cache = _caches.get(name)
+        if cache is None:
+            directory = os.path.join(os.getenv("HTTP_CACHE_DIR", DEFAULT_CACHE_DIR), name)
+            max_bytes = int(float(os.getenv("HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+            cache = HttpCache(directory, max_bytes)
+            _caches[name] = cache
+        return cache
@@ -0,0 +1,239 @@
+"""
+커넥션 풀링, 압축, 타임아웃, 재시도를 지원하는 공유 HTTP 세션 계층
+"""
+import os
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from utils.logger import setup_logger
+from utils.rate_limiter import get_rate_limiter, record_response
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_CONNECT_TIMEOUT = 5
+DEFAULT_READ_TIMEOUT = 20
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5
+DEFAULT_BACKOFF_JITTER = 0.5
+DEFAULT_POOL_MAXSIZE = 10
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/111.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Connection': 'keep-alive',
+}
+
+
+def _accept_encoding():
+    """brotli 디코더가 설치된 경우에만 br 압축 요청"""
+    try:
+        import brotli  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        pass
+    try:
+        import brotlicffi  # noqa: F401
+        return "gzip, deflate, br"
+    except ImportError:
+        return "gzip, deflate"
+
+
+class _RateLimitedRetry(Retry):
+    """
+    재시도 요청도 도메인 속도 제한기를 거치도록 하는 Retry
+
+    urllib3는 재시도를 HttpClient.get() 밖에서 직접 다시 보내므로, 재시도가 결정될 때마다
+    응답 상태를 속도 제한기에 알리고(429 등이면 속도를 낮춤) 토큰을 얻은 뒤 다시 보냅니다.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        host = getattr(_pool, "host", None)
+        if host:
+            if response is not None:
+                record_response(host, response.status, response.headers.get("Retry-After"))
+            get_rate_limiter(host).acquire()
+        return retry
+
+
+class _HostStats:
+    """호스트별 요청 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+
+class _ThreadSession:
+    """스레드 로컬에 보관하는 세션 소유자 (스레드가 끝나 소유자가 사라지면 세션을 닫음)"""
+
+    __slots__ = ("session", "__weakref__")
+
+    def __init__(self, session):
+        self.session = session
+
+
+class HttpClient:
+    """
+    스레드별 requests.Session을 관리하는 HTTP 클라이언트
+
+    requests.Session은 스레드 간 공유가 보장되지 않으므로 스레드마다 세션을 만들고,
+    각 세션은 호스트별 keep-alive 커넥션 풀과 재시도 정책을 가집니다.
+    크롤링 워커처럼 잠깐 쓰고 끝나는 스레드의 세션은 스레드가 종료될 때 닫아 커넥션을 정리합니다.
+    """
+
+    def __init__(self, name, timeout=None, retries=None, backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 backoff_jitter=DEFAULT_BACKOFF_JITTER, pool_maxsize=DEFAULT_POOL_MAXSIZE, headers=None):
+        """
+        Args:
+            name (str): 클라이언트 이름 (로그 구분용)
+            timeout (tuple, optional): (연결 타임아웃, 읽기 타임아웃) 초
+            retries (int, optional): 연결 오류 및 429/5xx 응답 시 최대 재시도 횟수
+            backoff_factor (float): 지수 백오프 계수
+            backoff_jitter (float): 백오프에 더할 최대 무작위 지연 (초)
+            pool_maxsize (int): 호스트당 유지할 최대 커넥션 수
+            headers (dict, optional): 기본 헤더에 추가할 헤더
+        """
+        if timeout is None:
+            timeout = (
+                float(os.getenv("HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT)),
+                float(os.getenv("HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT)),
+            )
+        if retries is None:
+            retries = int(os.getenv("HTTP_RETRIES", DEFAULT_RETRIES))
+        self.name = name
+        self.timeout = timeout
+        self.retry = _RateLimitedRetry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            backoff_factor=backoff_factor,
+            backoff_jitter=backoff_jitter,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self.pool_maxsize = pool_maxsize
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self.headers['Accept-Encoding'] = _accept_encoding()
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def session(self):
+        """현재 스레드의 세션 반환 (없으면 생성)"""
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_maxsize,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=self.retry,
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self.headers)
+            owner = self._local.owner = _ThreadSession(session)
+            # 스레드가 끝나면 스레드 로컬 값과 함께 소유자가 사라지므로 그때 세션을 닫음
+            weakref.finalize(owner, self._release, session)
+            with self._lock:
+                self._sessions.append(session)
+        return owner.session
+
+    def _release(self, session):
+        """종료된 스레드의 세션을 목록에서 빼고 닫음"""
+        with self._lock:
+            if session in self._sessions:
+                self._sessions.remove(session)
+        session.close()
+
+    def get(self, url, **kwargs):
+        """타임아웃과 재시도 정책이 적용된 GET 요청"""
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname or ""
+        # 도메인별 공유 속도 제한기에서 토큰을 얻은 뒤 요청
+        get_rate_limiter(url).acquire()
+        started = time.perf_counter()
+        try:
+            response = self.session().get(url, **kwargs)
+        except requests.RequestException:
+            self._record(host, time.perf_counter() - started, 0, error=True)
+            raise
+        record_response(url, response.status_code, response.headers.get("Retry-After"))
+        self._record(host, time.perf_counter() - started, len(response.content),
+                     error=response.status_code >= 400)
+        return response
+
+    def _record(self, host, elapsed, size, error=False):
+        with self._lock:
+            stats = self._stats.setdefault(host, _HostStats())
+            stats.requests += 1
+            stats.bytes += size
+            stats.elapsed += elapsed
+            if error:
+                stats.errors += 1
+
+    def pool_stats(self):
+        """
+        호스트별 풀 통계 반환
+
+        Returns:
+            dict: host -> {requests, errors, bytes, avg_ms, connections}
+                  connections는 실제로 새로 연 커넥션 수로, requests보다 작을수록 재사용이 잘 된 것입니다.
+        """
+        connections = {}
+        with self._lock:
+            sessions = list(self._sessions)
+        for session in sessions:
+            # 같은 어댑터가 http/https에 모두 마운트되어 있으므로 한 번만 집계
+            pools = session.get_adapter("https://").poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    connections[pool.host] = connections.get(pool.host, 0) + pool.num_connections
+        with self._lock:
+            return {
+                host: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "bytes": stats.bytes,
+                    "avg_ms": round(stats.elapsed / stats.requests * 1000, 1) if stats.requests else 0.0,
+                    "connections": connections.get(host, 0),
+                }
+                for host, stats in self._stats.items()
+            }
+
+    def close(self):
+        """모든 스레드의 세션 종료"""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._local = threading.local()
+
+
+# 이름 -> HttpClient
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_http_client(name, **kwargs):
+    """이름별로 공유되는 HttpClient 반환 (없으면 생성)"""
+    with _clients_lock:
+        client = _clients.get(name)
+        if client is None:
+            client = HttpClient(name, **kwargs)
+            _clients[name] = client
+        return client
@@ -0,0 +1,68 @@
+"""
+반복되는 문자열 값을 하나의 객체로 공유하는 인터닝 풀
+
+회사 이름, "Anywhere in the World" 같은 위치, 태그 문자열, 급여/보상금 문구는 여러 공고와
+여러 키워드 검색 결과에 같은 값으로 반복해서 나타납니다. 파싱할 때마다 .text.strip()이 새
+문자열 객체를 만들기 때문에 그대로 두면 같은 값이 캐시와 마지막 성공 결과에 수천 번 중복 저장됩니다.
+이 풀은 같은 값의 첫 객체를 기억해 두고 이후 같은 값이 들어오면 그 객체를 돌려주므로
+중복 값은 프로세스 전체에서 한 번만 저장됩니다.
+
+- 제목과 링크처럼 행마다 다른 값은 인터닝하지 않습니다 (레코드의 REPEATED_FIELDS 참고).
+- 풀 크기는 INTERN_POOL_SIZE로 제한하며, 가득 차면 비우고 다시 채웁니다. 이미 레코드가
+  참조하는 문자열은 그대로 유지되므로 결과에는 영향이 없습니다.
+- INTERN_POOL_SIZE=0이면 인터닝하지 않고 값을 그대로 돌려줍니다.
+"""
+import os
+import threading
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_MAX_SIZE = 50000  # 풀에 보관할 최대 고유 문자열 수
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class InternPool:
+    """같은 값의 문자열을 하나의 객체로 공유하는 클래스"""
+
+    def __init__(self, max_size=None):
+        """
+        Args:
+            max_size (int, optional): 보관할 최대 고유 문자열 수 (기본값: INTERN_POOL_SIZE 환경 변수 또는 50000, 0이면 비활성화)
+        """
+        if max_size is None:
+            max_size = int(os.getenv("INTERN_POOL_SIZE", DEFAULT_MAX_SIZE))
+        self.max_size = max_size
+        self._values = {}
+
+    def intern(self, value):
+        """value와 같은 값의 공유 문자열 반환 (문자열이 아니거나 풀이 비활성화되어 있으면 그대로 반환)"""
+        if self.max_size <= 0 or type(value) is not str:
+            return value
+        shared = self._values.get(value)
+        if shared is not None:
+            return shared
+        if len(self._values) >= self.max_size:
+            logger.info(f"인터닝 풀이 가득 차서 비웁니다: {len(self._values)}개")
+            self._values.clear()
+        # setdefault는 GIL 아래에서 원자적이므로 동시에 같은 값이 들어와도 먼저 저장된 객체를 공유
+        return self._values.setdefault(value, value)
+
+    def __len__(self):
+        return len(self._values)
+
+    def clear(self):
+        self._values.clear()
+
+
+def get_intern_pool():
+    """프로세스 전체에서 공유하는 인터닝 풀 반환"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = InternPool()
+        return _pool
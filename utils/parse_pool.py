@@ -0,0 +1,134 @@
+"""
+HTML 파싱 전용 프로세스 풀
+
+BeautifulSoup 파싱과 필드 추출은 CPU를 사용하는 작업이라 Flask 요청 스레드에서 실행하면
+GIL 때문에 동시에 여러 검색이 들어와도 코어 하나만 사용합니다. 이 모듈은 파싱 단계를
+워커 프로세스에서 실행합니다. HTML 콘텐츠를 넘기면 워커가 파싱과 추출까지 마친 작업 행
+(리스트)만 돌려주므로 파싱 트리는 프로세스 경계를 넘지 않습니다.
+
+- 대기 중인 파싱 작업 수는 PARSE_QUEUE_SIZE로 제한하며, 자리가 없으면 빈자리가 날 때까지 기다립니다.
+- PARSE_POOL_MIN_BYTES보다 작은 페이지는 프로세스 간 전송 비용이 파싱보다 커서 호출 스레드에서 바로 파싱합니다.
+- PARSE_WORKERS=0이면 풀을 사용하지 않고 항상 호출 스레드에서 파싱합니다.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_MIN_BYTES = 64 * 1024   # 이보다 작은 페이지는 호출 스레드에서 파싱
+DEFAULT_QUEUE_TIMEOUT = 30      # 대기열 자리를 기다리는 최대 시간 (초), 지나면 호출 스레드에서 파싱
+
+# 워커 프로세스에 전달할 파서 설정 (워커는 시작 시점의 환경 변수를 물려받으므로 호출마다 현재 값을 전달)
+FORWARDED_SETTINGS = ("HTML_PARSER_ENGINE", "HTML_PARTIAL_PARSE")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _run_with_settings(settings, parse, content):
+    """워커 프로세스에서 호출 측 파서 설정을 적용한 뒤 parse(content) 실행"""
+    for name, value in settings.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+    return parse(content)
+
+
+class ParsePool:
+    """파싱 함수를 워커 프로세스에서 실행하고 작은 페이지는 호출 스레드에서 처리하는 클래스"""
+
+    def __init__(self, workers=None, queue_size=None, min_bytes=None, queue_timeout=DEFAULT_QUEUE_TIMEOUT):
+        """
+        Args:
+            workers (int, optional): 워커 프로세스 수 (기본값: PARSE_WORKERS 환경 변수 또는 CPU 코어 수, 0이면 풀 미사용)
+            queue_size (int, optional): 동시에 제출할 수 있는 최대 파싱 작업 수 (기본값: PARSE_QUEUE_SIZE 환경 변수 또는 워커 수의 2배)
+            min_bytes (int, optional): 풀을 사용할 최소 페이지 크기 (기본값: PARSE_POOL_MIN_BYTES 환경 변수 또는 64KB)
+            queue_timeout (float, optional): 대기열 자리를 기다리는 최대 시간 (초)
+        """
+        if workers is None:
+            workers = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+        if queue_size is None:
+            queue_size = int(os.getenv("PARSE_QUEUE_SIZE", max(workers, 1) * 2))
+        if min_bytes is None:
+            min_bytes = int(os.getenv("PARSE_POOL_MIN_BYTES", DEFAULT_MIN_BYTES))
+        self.workers = workers
+        self.queue_size = queue_size
+        self.min_bytes = min_bytes
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(queue_size)
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                # Flask/브라우저 풀 스레드가 잡고 있는 잠금을 복제하지 않도록 fork 대신 spawn으로 워커 생성
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+                logger.info(f"파싱 프로세스 풀 시작: 워커 {self.workers}개, 대기열 {self.queue_size}개")
+            return self._executor
+
+    def _reset_executor(self, executor):
+        """비정상 종료된 풀을 버려 다음 호출에서 새로 만들도록 함"""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    def run(self, parse, content):
+        """
+        parse(content) 실행 결과 반환
+
+        Args:
+            parse (callable): 모듈 최상위 함수 (워커 프로세스로 전달할 수 있어야 함)
+            content (str | bytes): HTML 콘텐츠
+
+        parse에서 발생한 예외는 호출한 스레드에서 그대로 다시 발생합니다.
+        """
+        if self.workers <= 0 or len(content) < self.min_bytes:
+            return parse(content)
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            logger.warning(f"파싱 대기열이 가득 차 호출 스레드에서 파싱합니다 ({len(content)} bytes)")
+            return parse(content)
+        try:
+            executor = self._get_executor()
+            settings = {name: os.environ.get(name) for name in FORWARDED_SETTINGS}
+            try:
+                return executor.submit(_run_with_settings, settings, parse, content).result()
+            except BrokenProcessPool as e:
+                logger.error(f"파싱 프로세스 풀 오류, 호출 스레드에서 파싱합니다: {e}")
+                self._reset_executor(executor)
+                return parse(content)
+        finally:
+            self._slots.release()
+
+    def shutdown(self):
+        """워커 프로세스 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+def get_parse_pool():
+    """애플리케이션 전체에서 공유하는 ParsePool 반환 (없으면 생성)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool()
+        return _pool
+
+
+def shutdown_parse_pool():
+    """공유 ParsePool 종료 (애플리케이션 종료 시 호출)"""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
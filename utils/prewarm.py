@@ -0,0 +1,144 @@
+"""
+인기 키워드 캐시 예열 스케줄러
+
+/search 트래픽으로 키워드 인기도를 집계하고, 상위 키워드의 캐시가 만료되기 전에
+백그라운드에서 미리 다시 스크래핑합니다. 주기마다 갱신할 수 있는 키워드 수(크롤링 예산)를
+제한하고 갱신을 주기 전체에 고르게 분산하며, 실제 요청은 일반 검색과 같은 경로
+(도메인별 속도 제한기, 서킷 브레이커, single-flight)를 거치므로 소스별 요청 제한을 그대로 따릅니다.
+"""
+import os
+import threading
+import time
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_INTERVAL = 300       # 예열 주기 (초)
+DEFAULT_TOP_N = 20           # 예열 대상 인기 키워드 수
+DEFAULT_BUDGET = 10          # 주기마다 갱신할 최대 키워드 수 (크롤링 예산)
+DEFAULT_HALF_LIFE = 3600     # 인기도 점수가 절반으로 줄어드는 시간 (초)
+REFRESH_RATIO = 0.8          # 캐시 유지 시간의 이 비율이 지나면 갱신 대상
+MAX_TRACKED_KEYWORDS = 1000  # 인기도를 추적할 최대 키워드 수
+
+
+class KeywordPopularity:
+    """시간이 지날수록 감소하는 점수로 키워드 인기도를 집계하는 스레드 안전 클래스"""
+
+    def __init__(self, half_life=DEFAULT_HALF_LIFE):
+        self.half_life = half_life
+        self._scores = {}  # keyword -> (점수, 마지막 갱신 시각)
+        self._lock = threading.Lock()
+
+    def _decayed(self, score, updated, now):
+        return score * 0.5 ** ((now - updated) / self.half_life)
+
+    def record(self, keyword):
+        """검색 1회 기록"""
+        now = time.time()
+        with self._lock:
+            score, updated = self._scores.get(keyword, (0.0, now))
+            self._scores[keyword] = (self._decayed(score, updated, now) + 1.0, now)
+            if len(self._scores) > MAX_TRACKED_KEYWORDS:
+                # 점수가 가장 낮은 키워드부터 추적 중단
+                ranked = sorted(self._scores, key=lambda k: self._decayed(*self._scores[k], now))
+                for stale_keyword in ranked[:len(self._scores) - MAX_TRACKED_KEYWORDS]:
+                    del self._scores[stale_keyword]
+
+    def top(self, n):
+        """현재 점수가 높은 순서로 키워드 n개 반환"""
+        now = time.time()
+        with self._lock:
+            ranked = sorted(self._scores.items(), key=lambda item: self._decayed(*item[1], now), reverse=True)
+        return [keyword for keyword, _ in ranked[:n]]
+
+
+class CachePrewarmer:
+    """인기 키워드의 캐시를 만료 전에 백그라운드 스레드에서 갱신하는 스케줄러"""
+
+    def __init__(self, refresh, cache_age, cache_ttl, popularity=None, interval=None, top_n=None, budget=None):
+        """
+        Args:
+            refresh (callable): refresh(keyword) - 키워드를 다시 스크래핑해 캐시에 저장
+            cache_age (callable): cache_age(keyword) -> 캐시된 지 지난 시간(초), 캐시에 없으면 None
+            cache_ttl (float): 검색 결과 캐시 유지 시간 (초)
+            popularity (KeywordPopularity, optional): 인기도 집계기
+            interval (float, optional): 예열 주기 (기본값: PREWARM_INTERVAL 환경 변수 또는 300초)
+            top_n (int, optional): 예열 대상 인기 키워드 수 (기본값: PREWARM_TOP_N 환경 변수 또는 20)
+            budget (int, optional): 주기마다 갱신할 최대 키워드 수 (기본값: PREWARM_BUDGET 환경 변수 또는 10)
+        """
+        if interval is None:
+            interval = float(os.getenv("PREWARM_INTERVAL", DEFAULT_INTERVAL))
+        if top_n is None:
+            top_n = int(os.getenv("PREWARM_TOP_N", DEFAULT_TOP_N))
+        if budget is None:
+            budget = int(os.getenv("PREWARM_BUDGET", DEFAULT_BUDGET))
+        self.refresh = refresh
+        self.cache_age = cache_age
+        self.cache_ttl = cache_ttl
+        self.popularity = popularity or KeywordPopularity()
+        self.interval = interval
+        self.top_n = top_n
+        self.budget = budget
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def is_due(self, keyword):
+        """캐시에 없거나 만료가 가까워 갱신이 필요한지 여부"""
+        age = self.cache_age(keyword)
+        return age is None or age >= self.cache_ttl * REFRESH_RATIO
+
+    def plan(self):
+        """이번 주기에 갱신할 키워드 목록 (인기 순, 크롤링 예산 이내)"""
+        due = [keyword for keyword in self.popularity.top(self.top_n) if self.is_due(keyword)]
+        return due[:self.budget]
+
+    def run_cycle(self):
+        """
+        한 주기 실행 - 대상 키워드를 주기 전체에 고르게 나누어 하나씩 갱신
+
+        Returns:
+            int: 갱신한 키워드 수
+        """
+        keywords = self.plan()
+        if not keywords:
+            return 0
+        logger.info(f"캐시 예열 시작: {keywords}")
+        stagger = self.interval / len(keywords)
+        refreshed = 0
+        for i, keyword in enumerate(keywords):
+            if i and self._stop.wait(stagger):
+                break
+            # 대기하는 동안 사용자 검색으로 이미 갱신되었으면 건너뜀
+            if not self.is_due(keyword):
+                continue
+            try:
+                self.refresh(keyword)
+                refreshed += 1
+            except Exception as e:
+                logger.error(f"캐시 예열 중 오류 발생 (키워드 '{keyword}'): {e}")
+        logger.info(f"캐시 예열 완료: {refreshed}/{len(keywords)}개 키워드 갱신")
+        return refreshed
+
+    def _loop(self):
+        # 갱신이 주기 전체에 분산되므로 주기가 끝나면 남은 시간만 기다린 뒤 다음 주기 시작
+        wait = self.interval
+        while not self._stop.wait(wait):
+            started = time.monotonic()
+            self.run_cycle()
+            wait = max(0.0, self.interval - (time.monotonic() - started))
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="cache-prewarm", daemon=True)
+            self._thread.start()
+        logger.info(f"캐시 예열 스케줄러 시작: 주기 {self.interval:.0f}초, 상위 {self.top_n}개, 예산 {self.budget}개")
+
+    def stop(self):
+        """백그라운드 스레드 중지"""
+        self._stop.set()
@@ -0,0 +1,36 @@
+"""
+스크래핑 진행 단계 보고
+
+팬아웃 실행기가 소스 함수를 호출하는 동안 현재 스레드에 콜백을 등록해 두면,
+추출기는 report_phase("parsing")처럼 단계만 알리면 되고 누가 듣는지는 알 필요가 없습니다.
+"""
+import threading
+from contextlib import contextmanager
+
+# 진행 단계
+QUEUED = "queued"
+FETCHING = "fetching"
+PARSING = "parsing"
+DONE = "done"
+FAILED = "failed"
+STALE = "stale"
+
+_local = threading.local()
+
+
+@contextmanager
+def tracking(callback):
+    """with 블록 안에서 report_phase(phase)가 callback(phase)를 호출하도록 등록"""
+    previous = getattr(_local, "callback", None)
+    _local.callback = callback
+    try:
+        yield
+    finally:
+        _local.callback = previous
+
+
+def report_phase(phase):
+    """현재 스레드에 등록된 콜백에 진행 단계 전달 (등록된 콜백이 없으면 무시)"""
+    callback = getattr(_local, "callback", None)
+    if callback is not None:
+        callback(phase)
@@ -0,0 +1,144 @@
+"""
+도메인별 적응형 요청 속도 제한기 (토큰 버킷 + AIMD)
+
+모든 스레드가 도메인마다 하나의 토큰 버킷을 공유하며, 요청이 성공하면 속도를 조금씩 올리고
+(additive increase) 429/403/캡차 같은 차단 신호를 받으면 속도를 절반으로 낮춥니다
+(multiplicative decrease).
+"""
+import threading
+import time
+from urllib.parse import urlsplit
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 차단 신호로 간주하는 HTTP 상태 코드
+THROTTLE_STATUS_CODES = (403, 429, 503)
+
+# 도메인별 기본 설정: (초기 초당 요청 수, 최소, 최대, 버스트)
+DOMAIN_DEFAULTS = {
+    "weworkremotely.com": (2.0, 0.2, 5.0, 3),
+    "wanted.co.kr": (1.0, 0.1, 3.0, 2),
+    "remoteok.com": (0.5, 0.05, 1.0, 1),
+}
+FALLBACK_DEFAULTS = (5.0, 0.5, 20.0, 5)
+
+
+class AdaptiveRateLimiter:
+    """하나의 도메인에 대한 스레드 안전 토큰 버킷"""
+
+    def __init__(self, domain, rate, min_rate, max_rate, burst=1, increase=0.05, decrease=0.5):
+        """
+        Args:
+            domain (str): 도메인 이름
+            rate (float): 초기 초당 요청 수
+            min_rate (float): 차단 신호가 반복되어도 내려가지 않는 최소 속도
+            max_rate (float): 성공이 계속되어도 넘지 않는 최대 속도
+            burst (int): 한 번에 연속으로 보낼 수 있는 최대 요청 수
+            increase (float): 성공 1회당 더할 속도 (additive increase)
+            decrease (float): 차단 신호 1회당 곱할 비율 (multiplicative decrease)
+        """
+        self.domain = domain
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, timeout=None):
+        """
+        요청 한 건을 보낼 수 있을 때까지 대기
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초). 초과하면 TimeoutError
+
+        Returns:
+            float: 실제로 대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            # 토큰을 미리 예약하고 부족한 만큼 대기 (음수 토큰 = 대기 중인 요청)
+            self._tokens -= 1
+            wait = max(-self._tokens / self.rate if self._tokens < 0 else 0.0, self._blocked_until - now)
+            if timeout is not None and wait > timeout:
+                self._tokens += 1
+                raise TimeoutError(f"{self.domain} 요청 대기 시간 초과 ({wait:.1f}초 필요)")
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self):
+        """요청 성공 - 속도를 조금 올림"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self, retry_after=None):
+        """
+        차단 신호(429/403/캡차 등) - 속도를 낮추고 남은 토큰을 비움
+
+        Args:
+            retry_after (float, optional): 서버가 알려준 재시도 대기 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            rate = self.rate
+        logger.warning(f"[{self.domain}] 차단 신호 감지 - 요청 속도를 초당 {rate:.2f}회로 낮춤")
+
+
+# 도메인 -> AdaptiveRateLimiter
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def _base_domain(host):
+    """www. 등 하위 도메인을 설정 키에 맞춰 정규화"""
+    for domain in DOMAIN_DEFAULTS:
+        if host == domain or host.endswith("." + domain):
+            return domain
+    return host
+
+
+def get_rate_limiter(url_or_host):
+    """URL 또는 호스트에 해당하는 도메인 공유 속도 제한기 반환"""
+    host = urlsplit(url_or_host).hostname if "://" in url_or_host else url_or_host
+    domain = _base_domain(host or "")
+    with _limiters_lock:
+        limiter = _limiters.get(domain)
+        if limiter is None:
+            rate, min_rate, max_rate, burst = DOMAIN_DEFAULTS.get(domain, FALLBACK_DEFAULTS)
+            limiter = AdaptiveRateLimiter(domain, rate, min_rate, max_rate, burst)
+            _limiters[domain] = limiter
+        return limiter
+
+
+def _parse_retry_after(value):
+    """Retry-After 헤더(초 단위)를 숫자로 변환 (날짜 형식 등은 무시)"""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def record_response(url, status_code, retry_after=None):
+    """응답 상태 코드로 해당 도메인의 속도를 조정"""
+    limiter = get_rate_limiter(url)
+    if status_code in THROTTLE_STATUS_CODES:
+        limiter.on_throttle(_parse_retry_after(retry_after))
+    elif status_code < 400:
+        limiter.on_success()
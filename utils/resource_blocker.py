@@ -0,0 +1,197 @@
+"""
+헤드리스 스크래핑 시 불필요한 네트워크 리소스를 차단하는 요청 가로채기 모듈
+
+페이지 DOM만 BeautifulSoup으로 읽으므로 이미지, 폰트, 스타일시트, 동영상,
+서드파티 분석 스크립트는 내려받을 필요가 없습니다.
+"""
+import os
+import threading
+from urllib.parse import urlsplit
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 차단된 요청의 리소스 유형별 추정 크기 (바이트) - 실제로 내려받지 않으므로 추정치 사용
+ESTIMATED_RESOURCE_SIZES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 60_000,
+    "stylesheet": 30_000,
+    "script": 50_000,
+    "xhr": 5_000,
+    "fetch": 5_000,
+    "other": 10_000,
+}
+
+# 공통 서드파티 분석/광고 도메인
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "facebook.com",
+    "connect.facebook.net",
+    "hotjar.com",
+    "amplitude.com",
+    "braze.com",
+    "appboycdn.com",
+    "sentry.io",
+    "clarity.ms",
+    "criteo.com",
+    "ads-twitter.com",
+    "carbonads.com",
+    "buysellads.com",
+    "plausible.io",
+)
+
+
+def _domain_matches(host, domains):
+    """host가 domains 중 하나이거나 그 하위 도메인인지 확인"""
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+class BlockProfile:
+    """소스별 리소스 차단 규칙 (리소스 유형 및 도메인 기반)"""
+
+    def __init__(self, name, blocked_types=(), blocked_domains=(), allowed_domains=()):
+        """
+        Args:
+            name (str): 프로필 이름 (통계 구분용)
+            blocked_types (iterable): 차단할 Playwright resource_type 목록 (image, font 등)
+            blocked_domains (iterable): 유형과 관계없이 차단할 도메인 목록
+            allowed_domains (iterable): 어떤 규칙보다 우선하여 항상 허용할 도메인 목록
+        """
+        self.name = name
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.allowed_domains = tuple(allowed_domains)
+
+    def block_reason(self, url, resource_type):
+        """차단 사유 반환 ("type", "domain") - 허용되는 요청이면 None"""
+        host = urlsplit(url).hostname or ""
+        if _domain_matches(host, self.allowed_domains):
+            return None
+        if resource_type in self.blocked_types:
+            return "type"
+        if _domain_matches(host, self.blocked_domains):
+            return "domain"
+        return None
+
+
+class BlockingStats:
+    """차단된 요청 수와 절약된 바이트(추정) 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.allowed_requests = 0
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+        self.blocked_by_type = {}
+        self.blocked_by_domain = {}
+
+    def record_allowed(self):
+        with self._lock:
+            self.allowed_requests += 1
+
+    def record_blocked(self, resource_type, host):
+        with self._lock:
+            self.blocked_requests += 1
+            self.bytes_saved += ESTIMATED_RESOURCE_SIZES.get(resource_type, ESTIMATED_RESOURCE_SIZES["other"])
+            self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+            self.blocked_by_domain[host] = self.blocked_by_domain.get(host, 0) + 1
+
+    def snapshot(self):
+        """현재 통계를 딕셔너리로 반환"""
+        with self._lock:
+            return {
+                "allowed_requests": self.allowed_requests,
+                "blocked_requests": self.blocked_requests,
+                "bytes_saved": self.bytes_saved,
+                "blocked_by_type": dict(self.blocked_by_type),
+                "blocked_by_domain": dict(self.blocked_by_domain),
+            }
+
+
+# 프로필 이름 -> 누적 통계
+_stats = {}
+_stats_lock = threading.Lock()
+
+
+def get_blocking_stats(name=None):
+    """프로필별 누적 차단 통계 반환 (name 지정 시 해당 프로필만)"""
+    with _stats_lock:
+        if name is not None:
+            stats = _stats.get(name)
+            return stats.snapshot() if stats else BlockingStats().snapshot()
+        return {key: stats.snapshot() for key, stats in _stats.items()}
+
+
+def _stats_for(name):
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = BlockingStats()
+        return _stats[name]
+
+
+def is_blocking_enabled():
+    """SCRAPER_BLOCK_RESOURCES 환경 변수로 리소스 차단 사용 여부 확인 (기본값: true)"""
+    return os.getenv("SCRAPER_BLOCK_RESOURCES", "true").lower() not in ("false", "0", "no")
+
+
+def install_resource_blocker(page, profile):
+    """
+    페이지에 요청 가로채기 핸들러 설치
+
+    Args:
+        page: Playwright Page 객체
+        profile (BlockProfile): 적용할 차단 프로필
+
+    Returns:
+        BlockingStats: 이 페이지에서 발생한 요청만 집계하는 통계 객체
+    """
+    page_stats = BlockingStats()
+    total_stats = _stats_for(profile.name)
+
+    def handle(route):
+        request = route.request
+        reason = profile.block_reason(request.url, request.resource_type)
+        if reason is None:
+            page_stats.record_allowed()
+            total_stats.record_allowed()
+            route.continue_()
+            return
+        host = urlsplit(request.url).hostname or ""
+        page_stats.record_blocked(request.resource_type, host)
+        total_stats.record_blocked(request.resource_type, host)
+        route.abort()
+
+    page.route("**/*", handle)
+    return page_stats
+
+
+def log_page_stats(profile, page_stats):
+    """페이지 단위 차단 통계 로그 출력"""
+    snapshot = page_stats.snapshot()
+    logger.info(
+        f"[{profile.name}] 리소스 차단: {snapshot['blocked_requests']}개 요청 차단, "
+        f"{snapshot['allowed_requests']}개 허용, 약 {snapshot['bytes_saved'] / 1024:.0f}KB 절약 "
+        f"(유형별: {snapshot['blocked_by_type']})"
+    )
+
+
+# Wanted: React 앱이 XHR로 채용 공고를 불러오므로 스크립트/XHR은 허용
+WANTED_BLOCK_PROFILE = BlockProfile(
+    "wanted",
+    blocked_types=("image", "media", "font", "stylesheet"),
+    blocked_domains=TRACKER_DOMAINS,
+)
+
+# RemoteOK: Cloudflare 검사 스크립트는 항상 허용해야 캡차 판정에 영향이 없음
+REMOTEOK_BLOCK_PROFILE = BlockProfile(
+    "remoteok",
+    blocked_types=("image", "media", "font", "stylesheet"),
+    blocked_domains=TRACKER_DOMAINS,
+    allowed_domains=("challenges.cloudflare.com",),
+)
@@ -0,0 +1,121 @@
+"""
+무한 스크롤 페이지를 위한 이벤트 기반 스크롤 로더
+
+고정된 sleep 대신 채용 공고 요소 수가 늘어나는 것을 기다리고,
+수가 더 이상 늘지 않으면(plateau) 즉시 스크롤을 멈춥니다.
+"""
+import time
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_STEP_TIMEOUT = 3.0   # 스크롤 한 번 후 새 요소를 기다리는 최대 시간 (초)
+DEFAULT_DEADLINE = 20.0      # 전체 스크롤에 허용되는 최대 시간 (초)
+DEFAULT_PLATEAU_ROUNDS = 2   # 요소 수가 이 횟수만큼 연속으로 그대로면 중단
+
+_COUNT_INCREASED_JS = "([selector, count]) => document.querySelectorAll(selector).length > count"
+
+
+def count_items(page, item_selector):
+    """현재 페이지에서 item_selector에 해당하는 요소 수 반환"""
+    return page.evaluate("(selector) => document.querySelectorAll(selector).length", item_selector)
+
+
+def wait_for_items(page, item_selector, timeout=DEFAULT_STEP_TIMEOUT):
+    """첫 번째 요소가 나타날 때까지 대기 (timeout 내에 없으면 False)"""
+    try:
+        page.wait_for_selector(item_selector, timeout=timeout * 1000, state="attached")
+        return True
+    except Exception:
+        return False
+
+
+class _InFlightTracker:
+    """진행 중인 XHR/fetch 요청 추적 (네트워크 유휴 상태 판단용)"""
+
+    def __init__(self, page):
+        self.page = page
+        self.pending = set()
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_done)
+        page.on("requestfailed", self._on_done)
+
+    def _on_request(self, request):
+        if request.resource_type in ("xhr", "fetch"):
+            self.pending.add(request)
+
+    def _on_done(self, request):
+        self.pending.discard(request)
+
+    def detach(self):
+        for event, handler in (("request", self._on_request),
+                               ("requestfinished", self._on_done),
+                               ("requestfailed", self._on_done)):
+            try:
+                self.page.remove_listener(event, handler)
+            except Exception:
+                pass
+
+
+def _wait_for_more(page, item_selector, count, timeout):
+    """요소 수가 count보다 커질 때까지 최대 timeout초 대기"""
+    if timeout <= 0:
+        return False
+    try:
+        page.wait_for_function(_COUNT_INCREASED_JS, arg=[item_selector, count], timeout=timeout * 1000)
+        return True
+    except Exception:
+        return False
+
+
+def scroll_until_stable(page, item_selector, max_scrolls=20, step_timeout=DEFAULT_STEP_TIMEOUT,
+                        deadline=DEFAULT_DEADLINE, plateau_rounds=DEFAULT_PLATEAU_ROUNDS):
+    """
+    요소 수가 더 늘지 않을 때까지 페이지를 끝까지 스크롤
+
+    Args:
+        page: Playwright Page 객체
+        item_selector (str): 채용 공고 요소 CSS 선택자 (예: 'tr.job')
+        max_scrolls (int): 최대 스크롤 횟수
+        step_timeout (float): 스크롤 후 새 요소를 기다리는 최대 시간 (초)
+        deadline (float): 전체 스크롤 제한 시간 (초)
+        plateau_rounds (int): 요소 수가 연속으로 그대로인 횟수가 이 값에 도달하면 중단
+
+    Returns:
+        int: 최종 요소 수
+    """
+    started = time.monotonic()
+    end_at = started + deadline
+    tracker = _InFlightTracker(page)
+    count = count_items(page, item_selector)
+    stalled = 0
+    scrolls = 0
+
+    try:
+        while scrolls < max_scrolls and stalled < plateau_rounds:
+            remaining = end_at - time.monotonic()
+            if remaining <= 0:
+                logger.info(f"스크롤 제한 시간({deadline}초) 도달")
+                break
+
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            scrolls += 1
+
+            grew = _wait_for_more(page, item_selector, count, min(step_timeout, remaining))
+            # 요소가 늘지 않았지만 요청이 진행 중이면 응답이 끝날 때까지 한 번 더 대기
+            if not grew and tracker.pending:
+                grew = _wait_for_more(page, item_selector, count, min(step_timeout, end_at - time.monotonic()))
+
+            new_count = count_items(page, item_selector)
+            if grew or new_count > count:
+                stalled = 0
+            else:
+                stalled += 1
+            count = new_count
+    finally:
+        tracker.detach()
+
+    logger.info(f"스크롤 완료: {scrolls}회 스크롤, 요소 {count}개, {time.monotonic() - started:.2f}초 소요")
+    return count
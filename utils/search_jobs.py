@@ -0,0 +1,187 @@
+"""
+백그라운드 검색 작업 관리
+
+/search 요청은 검색 작업을 백그라운드 워커 풀에 넣고 작업 ID를 바로 반환하며,
+페이지는 작업 ID로 소스별 진행 상황과 최종 결과를 주기적으로 조회하거나
+Server-Sent Events로 소스별 결과가 나오는 즉시 전달받습니다.
+"""
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import setup_logger
+from utils.progress import DONE, QUEUED, STALE
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 기본 설정
+DEFAULT_JOB_WORKERS = 4   # 동시에 실행할 검색 작업 수
+DEFAULT_JOB_TTL = 600     # 완료된 작업을 보관하는 시간 (초)
+KEEPALIVE_SECONDS = 15    # 이벤트 스트림에서 새 이벤트가 없을 때 연결 유지 신호를 보내는 간격 (초)
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class SearchJob:
+    """검색 작업 하나의 상태 (소스별 진행 단계, 작업 수, 최종 결과)"""
+
+    def __init__(self, keywords, sources):
+        self.id = uuid.uuid4().hex
+        self.keywords = list(keywords)
+        self.status = JOB_QUEUED
+        self.created_at = time.time()
+        self.finished_at = None
+        self.result = None
+        self.error = None
+        # (키워드, 소스) -> {"state": 단계, "rows": 작업 수}
+        self.progress = {
+            (keyword, source): {"state": QUEUED, "rows": 0}
+            for keyword in self.keywords for source in sources
+        }
+        # 스트리밍용 이벤트 기록: (이벤트 이름, 데이터) - "summary" 또는 "failed"가 마지막 이벤트
+        self.events = []
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def _emit(self, event, data):
+        """이벤트를 기록하고 대기 중인 스트림을 깨움 (self._lock을 잡은 상태에서 호출)"""
+        self.events.append((event, data))
+        self._changed.notify_all()
+
+    def update_progress(self, keyword, source, phase, jobs=None):
+        """팬아웃 실행기의 진행 상황 콜백 (완료 시 해당 소스의 작업 목록을 rows 이벤트로 기록)"""
+        with self._lock:
+            entry = self.progress.setdefault((keyword, source), {"state": QUEUED, "rows": 0})
+            entry["state"] = phase
+            if jobs is not None:
+                entry["rows"] = len(jobs)
+            self._emit("progress", {"keyword": keyword, "source": source, "state": phase, "rows": entry["rows"]})
+            if jobs is not None and phase in (DONE, STALE):
+                self._emit("rows", {"keyword": keyword, "source": source, "stale": phase == STALE, "jobs": jobs})
+
+    def finish(self, result):
+        """작업 완료 처리 - 결과를 저장하고 요약 이벤트 기록"""
+        with self._lock:
+            self.result = result
+            self.status = JOB_DONE
+            self.finished_at = time.time()
+            # 요약에는 중복을 합친 최종 작업 목록(jobs, found_on)도 포함 - 스트림으로 받은 소스별 행을 이 목록으로 교체
+            self._emit("summary", result)
+
+    def fail(self, error):
+        """작업 실패 처리 - failed 이벤트 기록"""
+        with self._lock:
+            self.error = str(error)
+            self.status = JOB_FAILED
+            self.finished_at = time.time()
+            self._emit("failed", {"error": self.error})
+
+    def iter_events(self, keepalive=KEEPALIVE_SECONDS):
+        """
+        기록된 이벤트를 처음부터 순서대로 반환하고, 새 이벤트가 생길 때까지 대기하는 제너레이터
+
+        keepalive초 동안 새 이벤트가 없으면 연결 유지를 위해 None을 반환하며,
+        "summary" 또는 "failed" 이벤트를 반환한 뒤 종료합니다.
+        """
+        index = 0
+        while True:
+            with self._lock:
+                if index >= len(self.events):
+                    self._changed.wait(keepalive)
+                pending = self.events[index:]
+            if not pending:
+                yield None
+                continue
+            for event, data in pending:
+                yield event, data
+                if event in ("summary", "failed"):
+                    return
+            index += len(pending)
+
+    def to_dict(self):
+        """JSON 응답용 딕셔너리 반환 (완료된 경우 결과 포함)"""
+        with self._lock:
+            progress = [
+                {"keyword": keyword, "source": source, "state": entry["state"], "rows": entry["rows"]}
+                for (keyword, source), entry in self.progress.items()
+            ]
+        data = {
+            "id": self.id,
+            "status": self.status,
+            "keywords": self.keywords,
+            "progress": progress,
+            "rows_so_far": sum(entry["rows"] for entry in progress),
+        }
+        if self.status == JOB_DONE:
+            data["result"] = self.result
+        elif self.status == JOB_FAILED:
+            data["error"] = self.error
+        return data
+
+
+class SearchJobManager:
+    """검색 작업을 백그라운드 스레드 풀에서 실행하고 ID로 조회할 수 있게 보관하는 클래스"""
+
+    def __init__(self, max_workers=None, ttl=None):
+        if max_workers is None:
+            max_workers = int(os.getenv("SEARCH_JOB_WORKERS", DEFAULT_JOB_WORKERS))
+        if ttl is None:
+            ttl = float(os.getenv("SEARCH_JOB_TTL", DEFAULT_JOB_TTL))
+        self.ttl = ttl
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="search-job"
+        )
+
+    def _expire(self, now):
+        """보관 시간이 지난 완료 작업 삭제"""
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and now - job.finished_at > self.ttl]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def _run(self, job, runner):
+        job.status = JOB_RUNNING
+        try:
+            job.finish(runner(job))
+            logger.info(f"검색 작업 {job.id} 완료 ({time.time() - job.created_at:.2f}초)")
+        except Exception as e:
+            job.fail(e)
+            logger.error(f"검색 작업 {job.id} 실패: {e}")
+
+    def submit(self, keywords, sources, runner):
+        """
+        검색 작업을 대기열에 추가하고 바로 반환
+
+        Args:
+            keywords (list): 검색 키워드 목록
+            sources (list): 진행 상황을 표시할 소스 이름 목록
+            runner (callable): runner(job) -> JSON으로 직렬화 가능한 결과
+
+        Returns:
+            SearchJob: 생성된 작업
+        """
+        job = SearchJob(keywords, sources)
+        with self._lock:
+            self._expire(time.time())
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, runner)
+        logger.info(f"검색 작업 {job.id} 대기열 추가: 키워드 {job.keywords}")
+        return job
+
+    def get(self, job_id):
+        """작업 ID로 작업 조회 (없거나 만료되었으면 None)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self, wait=True):
+        """워커 풀 종료"""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,99 @@
+"""
+동일한 (소스, 키워드) 스크래핑 요청을 하나로 합치는 single-flight 계층
+
+같은 키에 대한 스크래핑이 이미 진행 중이면 새로 시작하지 않고,
+진행 중인 작업이 끝날 때까지 기다렸다가 그 결과(또는 예외)를 함께 사용합니다.
+"""
+import os
+import threading
+from utils.logger import setup_logger
+
+# 로거 설정
+logger = setup_logger(__name__)
+
+# 진행 중인 요청을 기다리는 최대 시간 (초)
+DEFAULT_WAIT_TIMEOUT = 180
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 호출만 실행하고 나머지 호출자는 그 결과를 공유하는 클래스"""
+
+    def __init__(self, timeout=None):
+        """
+        Args:
+            timeout (float, optional): 대기하는 호출자의 최대 대기 시간 (초, 기본값: SINGLE_FLIGHT_TIMEOUT 환경 변수 또는 180)
+        """
+        if timeout is None:
+            timeout = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", DEFAULT_WAIT_TIMEOUT))
+        self.timeout = timeout
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args):
+        """
+        key에 대한 호출이 진행 중이면 그 결과를 기다리고, 없으면 func(*args)를 직접 실행
+
+        Raises:
+            TimeoutError: 진행 중인 호출이 timeout 안에 끝나지 않은 경우
+            Exception: 진행 중인 호출에서 발생한 예외를 그대로 전달
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                call.waiters += 1
+
+        if leader:
+            try:
+                call.result = func(*args)
+                return call.result
+            except Exception as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                if call.waiters:
+                    logger.info(f"{key} 진행 중이던 요청 결과를 대기 중인 {call.waiters}개 요청과 공유")
+                call.done.set()
+
+        logger.info(f"{key} 이미 진행 중인 요청을 기다립니다")
+        if not call.done.wait(self.timeout):
+            raise TimeoutError(f"{key} 진행 중인 요청 대기 시간 초과 ({self.timeout:.0f}초)")
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def in_flight(self):
+        """현재 진행 중인 키 목록 반환"""
+        with self._lock:
+            return list(self._calls)
+
+
+def normalize_keyword(keyword):
+    """대소문자와 앞뒤 공백만 다른 키워드를 같은 키로 취급"""
+    return " ".join(keyword.split()).lower()
+
+
+# 모든 요청이 공유하는 single-flight 그룹
+_search_flight = SingleFlight()
+
+
+def coalesced(name, func):
+    """func(keyword)를 정규화된 (소스, 키워드) 단위로 합쳐 실행하는 함수 반환"""
+    def call(keyword):
+        return _search_flight.do((name, normalize_keyword(keyword)), func, keyword)
+    return call